@@ -5,23 +5,43 @@ Configuration constants for ObsidianSecure.
 import os
 from pathlib import Path
 
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+    return max(1, value)
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag ("0", "false", "no", "off" disable it) from the environment."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
 # Application metadata
 APP_NAME = "ObsidianSecure"
 APP_VERSION = "0.1.0"
 FILE_MAGIC = "OBSEC1"
-FORMAT_VERSION = 1
+FORMAT_VERSION = 2  # 1 = JSON header, 2 = binary header
 
 # Cryptographic parameters
 KDF_ALGORITHM = "argon2id"
 ARGON2_MEMORY_COST = 65536  # 64 MB in KiB
 ARGON2_TIME_COST = 3  # iterations
-ARGON2_PARALLELISM = 4  # threads
+ARGON2_PARALLELISM = 4  # lanes, each filled on its own thread by libargon2
 
 CIPHER_ALGORITHM = "AES-256-GCM"
 AES_KEY_SIZE = 32  # 256 bits
 SALT_SIZE = 16  # bytes
 NONCE_SIZE = 12  # bytes for GCM
 TAG_SIZE = 16  # bytes for GCM authentication tag
+GCM_CHUNK_SIZE = 32768  # bytes processed per call when streaming AES-GCM
+STREAM_ENCRYPT_THRESHOLD = 4 * 1024 * 1024  # files at least this large are encrypted as a stream
 
 # HKDF parameters
 HKDF_INFO_VAULT = b"ObsidianSecure.Vault.Key"
@@ -35,9 +55,19 @@ MARKDOWN_EXT = ".md"
 # Workspace configuration
 WORKSPACE_BASE = Path(os.getenv("LOCALAPPDATA", os.path.expanduser("~"))) / APP_NAME / "workspace"
 WORKSPACE_PREFIX = "workspace_"
+HASH_WORKERS = os.cpu_count() or 1  # Parallel file hashing for change detection
+SESSION_WORKERS = min(32, (os.cpu_count() or 1) * 2)  # Parallel file decrypt/encrypt on unlock/lock
 
 # Security settings
-SECURE_DELETE_PASSES = 3  # Number of overwrite passes for secure deletion
+SECURE_DELETE_PASSES = _env_int(
+    "OBSIDIANSECURE_DELETE_PASSES", 3
+)  # Number of random overwrite passes (1 is enough on SSDs)
+SECURE_DELETE_ZERO_PASS = _env_flag(
+    "OBSIDIANSECURE_DELETE_ZERO_PASS", True
+)  # Final zero pass after the random passes
+SECURE_DELETE_WORKERS = _env_int(
+    "OBSIDIANSECURE_DELETE_WORKERS", min(32, (os.cpu_count() or 1) * 4)
+)  # Parallel file overwrites (set to 1 for HDDs)
 AUTO_LOCK_TIMEOUT = 30 * 60  # 30 minutes in seconds (0 = disabled)
 
 # Obsidian configuration
@@ -49,3 +79,6 @@ OBSIDIAN_EXECUTABLE = os.path.expandvars(
 # Logging
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# GUI log view batching interval (milliseconds)
+LOG_FLUSH_INTERVAL_MS = 50
@@ -2,18 +2,36 @@
 Cryptographic primitives for ObsidianSecure.
 """
 
-from .kdf import derive_master_key
-from .cipher import encrypt_data, decrypt_data
+from .kdf import derive_master_key, derive_master_key_into
+from .cipher import (
+    encrypt_data,
+    decrypt_data,
+    decrypt_into,
+    encrypt_stream,
+    decrypt_stream,
+)
 from .hkdf import derive_vault_key, derive_file_key
-from .formats import EncryptedFile, create_encrypted_file, read_encrypted_file
+from .memory import secure_zero
+from .formats import (
+    EncryptedFile,
+    create_encrypted_file,
+    read_encrypted_file,
+    open_and_decrypt,
+)
 
 __all__ = [
     "derive_master_key",
+    "derive_master_key_into",
     "encrypt_data",
     "decrypt_data",
+    "decrypt_into",
+    "encrypt_stream",
+    "decrypt_stream",
+    "secure_zero",
     "derive_vault_key",
     "derive_file_key",
     "EncryptedFile",
     "create_encrypted_file",
     "read_encrypted_file",
+    "open_and_decrypt",
 ]
@@ -1,10 +1,48 @@
 """
 AES-256-GCM encryption and decryption.
+
+The ``cryptography`` AESGCM backend is used for all operations. It runs on
+OpenSSL, which already selects the AES-NI/PCLMULQDQ code paths at runtime.
 """
 
 import os
+import threading
+from typing import BinaryIO
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from ..config import NONCE_SIZE, AES_KEY_SIZE
+from ..config import NONCE_SIZE, AES_KEY_SIZE, TAG_SIZE, GCM_CHUNK_SIZE
+
+
+# Random nonces are sliced from a buffer refilled in bulk, so encrypting many
+# files costs one RNG call per _NONCE_BATCH nonces instead of one per file.
+_NONCE_BATCH = 341  # ~4 KiB of random data per refill
+_nonce_lock = threading.Lock()
+_nonce_buffer = b""
+_nonce_offset = 0
+
+
+def _reset_nonce_buffer() -> None:
+    """Discard buffered nonces (e.g. in a forked child)."""
+    global _nonce_buffer, _nonce_offset
+    _nonce_buffer = b""
+    _nonce_offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must never reuse nonces buffered by its parent
+    os.register_at_fork(after_in_child=_reset_nonce_buffer)
+
+
+def _random_nonce() -> bytes:
+    """Return a fresh random 12-byte nonce from the buffered pool."""
+    global _nonce_buffer, _nonce_offset
+    with _nonce_lock:
+        if _nonce_offset >= len(_nonce_buffer):
+            _nonce_buffer = os.urandom(NONCE_SIZE * _NONCE_BATCH)
+            _nonce_offset = 0
+        nonce = _nonce_buffer[_nonce_offset:_nonce_offset + NONCE_SIZE]
+        _nonce_offset += NONCE_SIZE
+    return nonce
 
 
 def encrypt_data(plaintext: bytes, key: bytes, nonce: bytes | None = None) -> tuple[bytes, bytes]:
@@ -25,14 +63,13 @@ def encrypt_data(plaintext: bytes, key: bytes, nonce: bytes | None = None) -> tu
     if len(key) != AES_KEY_SIZE:
         raise ValueError(f"Key must be {AES_KEY_SIZE} bytes")
 
+    # Generated nonces are always the right size; only check caller-supplied ones
     if nonce is None:
-        nonce = os.urandom(NONCE_SIZE)
-
-    if len(nonce) != NONCE_SIZE:
+        nonce = _random_nonce()
+    elif len(nonce) != NONCE_SIZE:
         raise ValueError(f"Nonce must be {NONCE_SIZE} bytes")
 
-    aesgcm = AESGCM(key)
-    ciphertext = aesgcm.encrypt(nonce, plaintext, associated_data=None)
+    ciphertext = AESGCM(bytes(key)).encrypt(nonce, plaintext, associated_data=None)
 
     return ciphertext, nonce
 
@@ -59,7 +96,178 @@ def decrypt_data(ciphertext: bytes, key: bytes, nonce: bytes) -> bytes:
     if len(nonce) != NONCE_SIZE:
         raise ValueError(f"Nonce must be {NONCE_SIZE} bytes")
 
-    aesgcm = AESGCM(key)
-    plaintext = aesgcm.decrypt(nonce, ciphertext, associated_data=None)
+    plaintext = AESGCM(bytes(key)).decrypt(nonce, ciphertext, associated_data=None)
 
     return plaintext
+
+
+def decrypt_into(
+    ciphertext: bytes | memoryview,
+    key: bytes,
+    nonce: bytes,
+    out: bytearray | memoryview,
+) -> int:
+    """
+    Decrypt data using AES-256-GCM into a caller-provided buffer.
+
+    Unlike :func:`decrypt_data`, no plaintext ``bytes`` object is created,
+    so the output buffer can be reused across files and wiped afterwards
+    with :func:`~obsidian_secure.crypto.memory.secure_zero`.
+
+    Args:
+        ciphertext: Encrypted data with authentication tag
+        key: 256-bit encryption key
+        nonce: 12-byte nonce used during encryption
+        out: Writable buffer of at least ``len(ciphertext) - TAG_SIZE`` bytes
+
+    Returns:
+        int: Number of plaintext bytes written to ``out``
+
+    Raises:
+        ValueError: If key, nonce, ciphertext or buffer size is incorrect
+        cryptography.exceptions.InvalidTag: If authentication fails
+
+    Note:
+        If authentication fails, ``out`` may already hold unauthenticated
+        plaintext and must not be used.
+    """
+    if len(key) != AES_KEY_SIZE:
+        raise ValueError(f"Key must be {AES_KEY_SIZE} bytes")
+
+    if len(nonce) != NONCE_SIZE:
+        raise ValueError(f"Nonce must be {NONCE_SIZE} bytes")
+
+    length = len(ciphertext) - TAG_SIZE
+    if length < 0:
+        raise ValueError("Ciphertext too short to contain authentication tag")
+
+    if len(out) < length:
+        raise ValueError(f"Output buffer must be at least {length} bytes")
+
+    decryptor = Cipher(algorithms.AES(bytes(key)), modes.GCM(nonce)).decryptor()
+
+    # Release views explicitly so callers can close an underlying mmap even
+    # when authentication fails and this frame is kept alive by a traceback
+    with memoryview(ciphertext) as view, view[:length] as body:
+        written = decryptor.update_into(body, out)
+        tag = bytes(view[length:])
+
+    decryptor.finalize_with_tag(tag)
+
+    return written
+
+
+def encrypt_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    key: bytes,
+    nonce: bytes | None = None,
+    chunk_size: int = GCM_CHUNK_SIZE,
+) -> bytes:
+    """
+    Encrypt a stream using AES-256-GCM.
+
+    Reads ``src`` until EOF in fixed-size chunks and writes the ciphertext
+    followed by the authentication tag to ``dst``. The output layout is
+    identical to :func:`encrypt_data`.
+
+    Args:
+        src: Readable binary stream with the plaintext
+        dst: Writable binary stream for the ciphertext
+        key: 256-bit encryption key
+        nonce: Optional 12-byte nonce (generated if None)
+        chunk_size: Number of bytes processed per update
+
+    Returns:
+        bytes: Nonce used for encryption
+
+    Raises:
+        ValueError: If key or nonce size is incorrect
+    """
+    if len(key) != AES_KEY_SIZE:
+        raise ValueError(f"Key must be {AES_KEY_SIZE} bytes")
+
+    # Generated nonces are always the right size; only check caller-supplied ones
+    if nonce is None:
+        nonce = _random_nonce()
+    elif len(nonce) != NONCE_SIZE:
+        raise ValueError(f"Nonce must be {NONCE_SIZE} bytes")
+
+    encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+
+    in_buf = bytearray(chunk_size)
+    out_buf = bytearray(chunk_size + 15)  # update_into needs block_size - 1 spare bytes
+    in_view = memoryview(in_buf)
+    out_view = memoryview(out_buf)
+
+    while n := src.readinto(in_buf):
+        written = encryptor.update_into(in_view[:n], out_buf)
+        dst.write(out_view[:written])
+
+    dst.write(encryptor.finalize())
+    dst.write(encryptor.tag)
+
+    return nonce
+
+
+def decrypt_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    key: bytes,
+    nonce: bytes,
+    chunk_size: int = GCM_CHUNK_SIZE,
+) -> None:
+    """
+    Decrypt a stream using AES-256-GCM.
+
+    ``src`` must be seekable and positioned at the start of the ciphertext;
+    everything up to EOF is treated as ciphertext with a trailing tag.
+
+    Args:
+        src: Seekable binary stream with ciphertext and tag
+        dst: Writable binary stream for the plaintext
+        key: 256-bit encryption key
+        nonce: 12-byte nonce used during encryption
+        chunk_size: Number of bytes processed per update
+
+    Raises:
+        ValueError: If key or nonce size is incorrect, or input is too short
+        cryptography.exceptions.InvalidTag: If authentication fails
+
+    Note:
+        Plaintext is written to ``dst`` before the tag is verified. If this
+        raises, everything written to ``dst`` must be discarded.
+    """
+    if len(key) != AES_KEY_SIZE:
+        raise ValueError(f"Key must be {AES_KEY_SIZE} bytes")
+
+    if len(nonce) != NONCE_SIZE:
+        raise ValueError(f"Nonce must be {NONCE_SIZE} bytes")
+
+    start = src.tell()
+    end = src.seek(0, os.SEEK_END)
+    remaining = end - start - TAG_SIZE
+
+    if remaining < 0:
+        raise ValueError("Ciphertext too short to contain authentication tag")
+
+    src.seek(end - TAG_SIZE)
+    tag = src.read(TAG_SIZE)
+    src.seek(start)
+
+    decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
+
+    in_buf = bytearray(chunk_size)
+    out_buf = bytearray(chunk_size + 15)
+    in_view = memoryview(in_buf)
+    out_view = memoryview(out_buf)
+
+    while remaining > 0:
+        n = src.readinto(in_view[:min(chunk_size, remaining)])
+        if not n:
+            raise ValueError("Unexpected end of ciphertext")
+        remaining -= n
+        written = decryptor.update_into(in_view[:n], out_buf)
+        dst.write(out_view[:written])
+
+    dst.write(decryptor.finalize_with_tag(tag))
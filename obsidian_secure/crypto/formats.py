@@ -1,11 +1,23 @@
 """
-Encrypted file format handling with JSON headers.
+Encrypted file format handling.
+
+Files are written with a fixed-layout binary header:
+
+    magic[6] | version u8 | kdf u8 | cipher u8 | salt[16] | nonce[12] |
+    type u8 | file_id_len u16 | file_id[file_id_len] | ciphertext
+
+Version 1 files, which use a length-prefixed JSON header, are still read.
 """
 
 import json
+import mmap
 import base64
+import struct
 from dataclasses import dataclass
-from typing import Literal
+from pathlib import Path
+from types import MappingProxyType
+from typing import BinaryIO, Literal, Mapping, Optional
+from .cipher import decrypt_into
 from ..config import (
     FILE_MAGIC,
     FORMAT_VERSION,
@@ -14,8 +26,29 @@ from ..config import (
     ARGON2_MEMORY_COST,
     ARGON2_TIME_COST,
     ARGON2_PARALLELISM,
+    SALT_SIZE,
+    NONCE_SIZE,
+    TAG_SIZE,
 )
 
+_HEADER = struct.Struct(f">6sBBB{SALT_SIZE}s{NONCE_SIZE}sBH")
+_MAGIC_BYTES = FILE_MAGIC.encode('ascii')
+
+# KDF parameters are fixed by the format version; shared read-only by all headers
+_KDF_PARAMS = MappingProxyType({
+    "memory_cost": ARGON2_MEMORY_COST,
+    "time_cost": ARGON2_TIME_COST,
+    "parallelism": ARGON2_PARALLELISM,
+})
+
+_KDF_IDS = {"argon2id": 1}
+_CIPHER_IDS = {"AES-256-GCM": 1}
+_FILE_TYPE_IDS = {"file": 1, "index": 2}
+
+_KDF_NAMES = {v: k for k, v in _KDF_IDS.items()}
+_CIPHER_NAMES = {v: k for k, v in _CIPHER_IDS.items()}
+_FILE_TYPE_NAMES = {v: k for k, v in _FILE_TYPE_IDS.items()}
+
 
 @dataclass
 class EncryptedFile:
@@ -25,7 +58,7 @@ class EncryptedFile:
     magic: str
     version: int
     kdf: str
-    kdf_params: dict
+    kdf_params: Mapping[str, int]
     cipher: str
     salt: bytes
     nonce: bytes
@@ -39,37 +72,54 @@ class EncryptedFile:
         """
         Serialize the encrypted file to bytes.
 
+        Only the current binary format can be written. An empty salt is
+        stored as zeros, so it reads back as ``SALT_SIZE`` zero bytes.
+
         Returns:
             bytes: Complete encrypted file (header + body)
+
+        Raises:
+            ValueError: If a header field cannot be encoded
         """
-        header = {
-            "magic": self.magic,
-            "version": self.version,
-            "kdf": self.kdf,
-            "kdf_params": self.kdf_params,
-            "cipher": self.cipher,
-            "salt": base64.b64encode(self.salt).decode('utf-8'),
-            "nonce": base64.b64encode(self.nonce).decode('utf-8'),
-            "file_id": self.file_id,
-            "type": self.file_type,
-        }
-
-        header_json = json.dumps(header, indent=2)
-        header_bytes = header_json.encode('utf-8')
-
-        # Format: [4 bytes header length][header][body]
-        header_length = len(header_bytes)
-        length_prefix = header_length.to_bytes(4, byteorder='big')
-
-        return length_prefix + header_bytes + self.ciphertext
+        if self.version != FORMAT_VERSION:
+            raise ValueError(f"Cannot write format version {self.version}")
+
+        if len(self.nonce) != NONCE_SIZE:
+            raise ValueError(f"Nonce must be {NONCE_SIZE} bytes")
+
+        # Files inside a vault may carry an empty salt; it is stored as zeros
+        if len(self.salt) not in (0, SALT_SIZE):
+            raise ValueError(f"Salt must be {SALT_SIZE} bytes")
+
+        try:
+            kdf_id = _KDF_IDS[self.kdf]
+            cipher_id = _CIPHER_IDS[self.cipher]
+            type_id = _FILE_TYPE_IDS[self.file_type]
+        except KeyError as e:
+            raise ValueError(f"Unsupported header value: {e}")
+
+        file_id_bytes = self.file_id.encode('utf-8')
+
+        header = _HEADER.pack(
+            _MAGIC_BYTES,
+            self.version,
+            kdf_id,
+            cipher_id,
+            self.salt,
+            self.nonce,
+            type_id,
+            len(file_id_bytes),
+        )
+
+        return header + file_id_bytes + self.ciphertext
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "EncryptedFile":
+    def from_bytes(cls, data: bytes | memoryview) -> "EncryptedFile":
         """
         Deserialize an encrypted file from bytes.
 
         Args:
-            data: Complete encrypted file data
+            data: Complete encrypted file data (bytes or a memoryview over it)
 
         Returns:
             EncryptedFile: Parsed encrypted file
@@ -77,45 +127,111 @@ class EncryptedFile:
         Raises:
             ValueError: If file format is invalid
         """
-        if len(data) < 4:
-            raise ValueError("File too short to contain header length")
+        fields, body_offset = _parse_header(data)
+        return cls(**fields, ciphertext=bytes(data[body_offset:]))
 
-        # Read header length
-        header_length = int.from_bytes(data[0:4], byteorder='big')
 
-        if len(data) < 4 + header_length:
-            raise ValueError("File too short to contain header")
+def _parse_header(data: bytes | memoryview) -> tuple[dict, int]:
+    """
+    Parse the header of an encrypted file.
 
-        # Parse header
-        header_bytes = data[4:4 + header_length]
-        try:
-            header = json.loads(header_bytes.decode('utf-8'))
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            raise ValueError(f"Invalid header JSON: {e}")
-
-        # Validate magic
-        if header.get("magic") != FILE_MAGIC:
-            raise ValueError(f"Invalid magic: expected {FILE_MAGIC}, got {header.get('magic')}")
-
-        # Parse body
-        ciphertext = data[4 + header_length:]
-
-        return cls(
-            magic=header["magic"],
-            version=header["version"],
-            kdf=header["kdf"],
-            kdf_params=header["kdf_params"],
-            cipher=header["cipher"],
-            salt=base64.b64decode(header["salt"]),
-            nonce=base64.b64decode(header["nonce"]),
-            file_id=header["file_id"],
-            file_type=header["type"],
-            ciphertext=ciphertext,
-        )
+    Args:
+        data: Encrypted file data, at least up to the end of the header
+
+    Returns:
+        tuple: (EncryptedFile header fields, offset of the ciphertext)
+
+    Raises:
+        ValueError: If the header is invalid
+    """
+    if data[:len(_MAGIC_BYTES)] != _MAGIC_BYTES:
+        return _parse_legacy_header(data)
+
+    if len(data) < _HEADER.size:
+        raise ValueError("File too short to contain header")
+
+    (
+        _magic,
+        version,
+        kdf_id,
+        cipher_id,
+        salt,
+        nonce,
+        type_id,
+        file_id_length,
+    ) = _HEADER.unpack_from(data, 0)
+
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version: {version}")
+
+    body_offset = _HEADER.size + file_id_length
+
+    if len(data) < body_offset:
+        raise ValueError("File too short to contain file ID")
+
+    try:
+        kdf = _KDF_NAMES[kdf_id]
+        cipher = _CIPHER_NAMES[cipher_id]
+        file_type = _FILE_TYPE_NAMES[type_id]
+        file_id = bytes(data[_HEADER.size:body_offset]).decode('utf-8')
+    except (KeyError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid header: {e}")
+
+    fields = {
+        "magic": FILE_MAGIC,
+        "version": version,
+        "kdf": kdf,
+        "kdf_params": _KDF_PARAMS,
+        "cipher": cipher,
+        "salt": salt,
+        "nonce": nonce,
+        "file_id": file_id,
+        "file_type": file_type,
+    }
+
+    return fields, body_offset
+
+
+def _parse_legacy_header(data: bytes | memoryview) -> tuple[dict, int]:
+    """Parse a version 1 length-prefixed JSON header."""
+    if len(data) < 4:
+        raise ValueError("File too short to contain header length")
+
+    # Read header length
+    header_length = int.from_bytes(data[0:4], byteorder='big')
+
+    if len(data) < 4 + header_length:
+        raise ValueError("File too short to contain header")
+
+    # Parse header
+    header_bytes = bytes(data[4:4 + header_length])
+    try:
+        header = json.loads(header_bytes.decode('utf-8'))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid header JSON: {e}")
+
+    # Validate magic
+    if header.get("magic") != FILE_MAGIC:
+        raise ValueError(f"Invalid magic: expected {FILE_MAGIC}, got {header.get('magic')}")
+
+    fields = {
+        "magic": header["magic"],
+        "version": header["version"],
+        "kdf": header["kdf"],
+        "kdf_params": header["kdf_params"],
+        "cipher": header["cipher"],
+        "salt": base64.b64decode(header["salt"]),
+        "nonce": base64.b64decode(header["nonce"]),
+        "file_id": header["file_id"],
+        "file_type": header["type"],
+    }
+
+    return fields, 4 + header_length
 
 
 def create_encrypted_file(
-    plaintext: bytes,
+    *,
+    plaintext: Optional[bytes] = None,
     file_id: str,
     file_type: Literal["file", "index"],
     ciphertext: bytes,
@@ -126,7 +242,7 @@ def create_encrypted_file(
     Create an EncryptedFile object with standard parameters.
 
     Args:
-        plaintext: Original plaintext (not stored, just for reference)
+        plaintext: Deprecated and ignored; the plaintext is never stored
         file_id: Unique file identifier
         file_type: Type of file ("file" or "index")
         ciphertext: Encrypted data with authentication tag
@@ -136,17 +252,11 @@ def create_encrypted_file(
     Returns:
         EncryptedFile: Encrypted file object
     """
-    kdf_params = {
-        "memory_cost": ARGON2_MEMORY_COST,
-        "time_cost": ARGON2_TIME_COST,
-        "parallelism": ARGON2_PARALLELISM,
-    }
-
     return EncryptedFile(
         magic=FILE_MAGIC,
         version=FORMAT_VERSION,
         kdf=KDF_ALGORITHM,
-        kdf_params=kdf_params,
+        kdf_params=_KDF_PARAMS,
         cipher=CIPHER_ALGORITHM,
         salt=salt,
         nonce=nonce,
@@ -156,12 +266,12 @@ def create_encrypted_file(
     )
 
 
-def read_encrypted_file(file_path: str) -> EncryptedFile:
+def read_encrypted_file(file_path: str | Path | BinaryIO) -> EncryptedFile:
     """
     Read and parse an encrypted file from disk.
 
     Args:
-        file_path: Path to encrypted file
+        file_path: Path to encrypted file, or an open binary file object
 
     Returns:
         EncryptedFile: Parsed encrypted file
@@ -170,7 +280,55 @@ def read_encrypted_file(file_path: str) -> EncryptedFile:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is invalid
     """
+    if hasattr(file_path, "read"):
+        return EncryptedFile.from_bytes(file_path.read())
+
     with open(file_path, 'rb') as f:
-        data = f.read()
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return EncryptedFile.from_bytes(f.read())
+
+        # Parse straight from the mapping so only the body is copied once
+        with mapped, memoryview(mapped) as view:
+            return EncryptedFile.from_bytes(view)
+
+
+def open_and_decrypt(file_path: str | Path, key: bytes) -> bytearray:
+    """
+    Read, parse, and decrypt an encrypted file in a single pass.
+
+    The file is memory-mapped and the ciphertext is decrypted straight from
+    the mapping into one preallocated buffer, without an intermediate
+    ``EncryptedFile.ciphertext`` copy.
+
+    Args:
+        file_path: Path to encrypted file
+        key: 256-bit file key
+
+    Returns:
+        bytearray: Decrypted plaintext (can be wiped with ``secure_zero``)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is invalid
+        cryptography.exceptions.InvalidTag: If authentication fails
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            raise ValueError("File too short to contain header length")
+
+        with mapped, memoryview(mapped) as view:
+            fields, body_offset = _parse_header(view)
+            body = view[body_offset:]
+            out = bytearray(max(len(body) - TAG_SIZE, 0))
+            try:
+                decrypt_into(body, key, fields["nonce"], out)
+            finally:
+                body.release()
 
-    return EncryptedFile.from_bytes(data)
+    return out
@@ -6,42 +6,56 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from ..config import HKDF_INFO_VAULT, HKDF_INFO_FILE, AES_KEY_SIZE
 
+# Hash algorithm objects are stateless, so one instance serves every HKDF
+_SHA256 = hashes.SHA256()
 
-def derive_vault_key(master_key: bytes, vault_id: str) -> bytes:
+
+def _id_bytes(identifier: str | bytes) -> bytes:
+    """Return an identifier as UTF-8 bytes, encoding only if needed."""
+    if isinstance(identifier, bytes):
+        return identifier
+    return identifier.encode('utf-8')
+
+
+def derive_vault_key(master_key: bytes | bytearray, vault_id: str | bytes) -> bytes:
     """
     Derive a vault-specific key from the master key.
 
     Args:
-        master_key: The master key derived from password
-        vault_id: Unique identifier for the vault
+        master_key: The master key derived from password (bytes or a wipeable bytearray)
+        vault_id: Unique identifier for the vault (str or UTF-8 bytes)
 
     Returns:
         bytes: Vault-specific key
     """
     hkdf = HKDF(
-        algorithm=hashes.SHA256(),
+        algorithm=_SHA256,
         length=AES_KEY_SIZE,
-        salt=vault_id.encode('utf-8'),
+        salt=_id_bytes(vault_id),
         info=HKDF_INFO_VAULT,
     )
     return hkdf.derive(master_key)
 
 
-def derive_file_key(vault_key: bytes, file_id: str) -> bytes:
+def derive_file_key(vault_key: bytes, file_id: str | bytes) -> bytes:
     """
     Derive a file-specific key from the vault key.
 
     Args:
         vault_key: The vault-specific key
-        file_id: Unique identifier for the file
+        file_id: Unique identifier for the file (str or UTF-8 bytes)
 
     Returns:
         bytes: File-specific key
     """
+    # The vault key is already uniformly random, so HKDF-Expand alone would
+    # be sound here (RFC 5869 section 3.3). The extract step is kept because
+    # skipping it changes every file key and would make existing vaults
+    # unreadable; sessions derive each file key once and keep it anyway.
     hkdf = HKDF(
-        algorithm=hashes.SHA256(),
+        algorithm=_SHA256,
         length=AES_KEY_SIZE,
-        salt=file_id.encode('utf-8'),
+        salt=_id_bytes(file_id),
         info=HKDF_INFO_FILE,
     )
     return hkdf.derive(vault_key)
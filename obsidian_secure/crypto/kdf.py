@@ -3,8 +3,10 @@ Key Derivation Functions using Argon2id.
 """
 
 import os
+import hmac
 from argon2 import PasswordHasher, low_level
 from argon2.low_level import Type
+from .memory import secure_zero
 from ..config import (
     ARGON2_MEMORY_COST,
     ARGON2_TIME_COST,
@@ -13,6 +15,15 @@ from ..config import (
     AES_KEY_SIZE,
 )
 
+# Argon2id parameters, built once instead of on every derivation
+_ARGON2_PARAMS = {
+    "time_cost": ARGON2_TIME_COST,
+    "memory_cost": ARGON2_MEMORY_COST,
+    "parallelism": ARGON2_PARALLELISM,
+    "hash_len": AES_KEY_SIZE,
+    "type": Type.ID,  # Argon2id
+}
+
 
 def derive_master_key(password: str, salt: bytes | None = None) -> tuple[bytes, bytes]:
     """
@@ -41,16 +52,64 @@ def derive_master_key(password: str, salt: bytes | None = None) -> tuple[bytes,
     master_key = low_level.hash_secret_raw(
         secret=password.encode('utf-8'),
         salt=salt,
-        time_cost=ARGON2_TIME_COST,
-        memory_cost=ARGON2_MEMORY_COST,
-        parallelism=ARGON2_PARALLELISM,
-        hash_len=AES_KEY_SIZE,
-        type=Type.ID  # Argon2id
+        **_ARGON2_PARAMS,
     )
 
     return master_key, salt
 
 
+def derive_master_key_into(password: str, salt: bytes, out: bytearray) -> None:
+    """
+    Derive a master key from a password using Argon2id into a caller-owned buffer.
+
+    Produces the same key as :func:`derive_master_key`, but libargon2 writes
+    it straight into ``out``, so no immutable copy of the key is created and
+    the caller can wipe it with :func:`~obsidian_secure.crypto.memory.secure_zero`.
+    The UTF-8 encoded password is likewise held in a buffer that is wiped.
+
+    Args:
+        password: The master password
+        salt: Salt stored with the vault
+        out: Writable buffer of exactly AES_KEY_SIZE bytes
+
+    Raises:
+        ValueError: If password is empty or salt or buffer size is incorrect
+        argon2.exceptions.HashingError: If libargon2 fails
+    """
+    if not password:
+        raise ValueError("Password cannot be empty")
+
+    if len(salt) != SALT_SIZE:
+        raise ValueError(f"Salt must be {SALT_SIZE} bytes")
+
+    if len(out) != AES_KEY_SIZE:
+        raise ValueError(f"Output buffer must be {AES_KEY_SIZE} bytes")
+
+    ffi, lib = low_level.ffi, low_level.lib
+    secret = bytearray(password, 'utf-8')
+    try:
+        rv = lib.argon2_hash(
+            ARGON2_TIME_COST,
+            ARGON2_MEMORY_COST,
+            ARGON2_PARALLELISM,
+            ffi.from_buffer(secret),
+            len(secret),
+            ffi.from_buffer(salt),
+            len(salt),
+            ffi.from_buffer(out),
+            len(out),
+            ffi.NULL,
+            0,
+            Type.ID.value,
+            low_level.ARGON2_VERSION,
+        )
+    finally:
+        secure_zero(secret)
+
+    if rv != lib.ARGON2_OK:
+        raise low_level.HashingError(low_level.error_to_str(rv))
+
+
 def verify_password(password: str, salt: bytes, expected_key: bytes) -> bool:
     """
     Verify a password by re-deriving the key and comparing.
@@ -65,7 +124,8 @@ def verify_password(password: str, salt: bytes, expected_key: bytes) -> bool:
     """
     try:
         derived_key, _ = derive_master_key(password, salt)
-        # Constant-time comparison
-        return low_level.verify_secret(expected_key, derived_key, Type.ID)
-    except Exception:
+    except ValueError:
         return False
+
+    # Constant-time comparison of the raw keys
+    return hmac.compare_digest(derived_key, expected_key)
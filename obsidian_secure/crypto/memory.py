@@ -0,0 +1,26 @@
+"""
+Helpers for wiping sensitive data held in mutable buffers.
+"""
+
+import ctypes
+
+
+def secure_zero(buf: bytearray | memoryview) -> None:
+    """
+    Overwrite a mutable buffer with zeros in place.
+
+    Immutable ``bytes`` cannot be wiped from Python, so keys and plaintext
+    that need wiping should be held in a ``bytearray``.
+
+    Args:
+        buf: Writable buffer to wipe
+
+    Raises:
+        TypeError: If the buffer is read-only
+    """
+    size = len(buf)
+    if size == 0:
+        return
+
+    array = (ctypes.c_char * size).from_buffer(buf)
+    ctypes.memset(ctypes.addressof(array), 0, size)
@@ -15,6 +15,9 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
+# Default directory for file dialogs
+_HOME_DIR = str(Path.home())
+
 
 class PasswordDialog(QDialog):
     """Dialog for entering vault password."""
@@ -153,7 +156,7 @@ class CreateVaultDialog(QDialog):
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Vault Directory",
-            str(Path.home()),
+            _HOME_DIR,
         )
 
         if directory:
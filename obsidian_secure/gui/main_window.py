@@ -17,36 +17,44 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QSplitter,
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QFont, QIcon
 
 from .dialogs import PasswordDialog, CreateVaultDialog
 from .vault_tree import VaultTreeWidget
 from ..session import SessionManager
 from ..vault import VaultManager, is_valid_vault
-from ..config import APP_NAME, APP_VERSION
+from ..config import APP_NAME, APP_VERSION, LOG_FLUSH_INTERVAL_MS
 
+# Default directory for file dialogs
+_HOME_DIR = str(Path.home())
 
-class WorkerThread(QThread):
-    """Worker thread for long-running operations."""
+
+class _TaskSignals(QObject):
+    """Signals emitted by a VaultTask (QRunnable is not a QObject)."""
 
     finished = Signal(object)  # Result
     error = Signal(str)  # Error message
     progress = Signal(str)  # Progress message
 
+
+class VaultTask(QRunnable):
+    """Pooled task for long-running operations."""
+
     def __init__(self, func, *args, **kwargs):
         super().__init__()
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.signals = _TaskSignals()
 
     def run(self):
-        """Run the worker function."""
+        """Run the task function."""
         try:
             result = self.func(*self.args, **self.kwargs)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -68,7 +76,20 @@ class MainWindow(QMainWindow):
         self.is_unlocked = False
 
         self._setup_ui()
-        self._check_crash_recovery()
+        # Operations share the global pool; their signal objects are kept
+        # referenced until the queued result has been delivered
+        self._thread_pool = QThreadPool.globalInstance()
+        self._pending_tasks: set[_TaskSignals] = set()
+
+        # Log lines are batched and appended once per flush interval
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Defer so the window is shown before the workspace scan runs
+        QTimer.singleShot(0, self._check_crash_recovery)
 
     def _setup_ui(self):
         """Set up the UI components."""
@@ -159,11 +180,21 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.progress_bar)
 
     def _check_crash_recovery(self):
-        """Check for leftover workspaces and prompt for recovery."""
+        """Scan for leftover workspaces in the background."""
         from ..session.workspace import Workspace
 
-        existing = Workspace.find_existing_workspaces()
+        self._run_in_background(
+            Workspace.find_existing_workspaces,
+            self._prompt_crash_recovery,
+        )
 
+    def _prompt_crash_recovery(self, existing: list[Path]):
+        """
+        Prompt to clean up leftover workspaces.
+
+        Args:
+            existing: Workspace paths found by the scan
+        """
         if existing:
             reply = QMessageBox.question(
                 self,
@@ -176,23 +207,36 @@ class MainWindow(QMainWindow):
 
             if reply == QMessageBox.StandardButton.Yes:
                 self._log("Cleaning up leftover workspaces...")
-                from ..io import secure_delete_directory
-
-                for workspace_path in existing:
-                    try:
-                        secure_delete_directory(workspace_path)
-                        self._log(f"Deleted: {workspace_path.name}")
-                    except Exception as e:
-                        self._log(f"Error deleting {workspace_path.name}: {e}")
-
-                self._log("Cleanup complete.")
+                self._run_in_background(
+                    lambda progress: self._delete_workspaces(existing, progress),
+                    lambda _: self._log("Cleanup complete."),
+                    on_progress=self._log,
+                )
+
+    @staticmethod
+    def _delete_workspaces(workspace_paths: list[Path], progress) -> None:
+        """
+        Securely delete leftover workspaces (runs in a worker thread).
+
+        Args:
+            workspace_paths: Workspaces to delete
+            progress: Callable receiving one log message per workspace
+        """
+        from ..io import secure_delete_directory
+
+        for workspace_path in workspace_paths:
+            try:
+                secure_delete_directory(workspace_path)
+                progress(f"Deleted: {workspace_path.name}")
+            except Exception as e:
+                progress(f"Error deleting {workspace_path.name}: {e}")
 
     def _select_vault(self):
         """Open dialog to select an existing vault."""
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Vault Directory",
-            str(Path.home()),
+            _HOME_DIR,
         )
 
         if not directory:
@@ -227,16 +271,10 @@ class MainWindow(QMainWindow):
         self._log(f"Creating vault at {vault_path}...")
         self._show_progress("Creating vault...")
 
-        def create():
-            return VaultManager.create_vault(vault_path, password, vault_name)
-
-        worker = WorkerThread(create)
-        worker.finished.connect(lambda vault_id: self._on_vault_created(vault_path, vault_id))
-        worker.error.connect(self._on_operation_error)
-        worker.start()
-
-        # Store worker to prevent garbage collection
-        self._worker = worker
+        self._run_in_background(
+            lambda: VaultManager.create_vault(vault_path, password, vault_name),
+            lambda vault_id: self._on_vault_created(vault_path, vault_id),
+        )
 
     def _on_vault_created(self, vault_path: Path, vault_id: str):
         """Handle vault creation completion."""
@@ -275,12 +313,7 @@ class MainWindow(QMainWindow):
             workspace = self.session_manager.unlock(password)
             return workspace
 
-        worker = WorkerThread(unlock)
-        worker.finished.connect(self._on_vault_unlocked)
-        worker.error.connect(self._on_operation_error)
-        worker.start()
-
-        self._worker = worker
+        self._run_in_background(unlock, self._on_vault_unlocked)
 
     def _on_vault_unlocked(self, workspace):
         """Handle vault unlock completion."""
@@ -321,15 +354,7 @@ class MainWindow(QMainWindow):
         self._log("Locking vault...")
         self._show_progress("Locking vault...")
 
-        def lock():
-            self.session_manager.lock()
-
-        worker = WorkerThread(lock)
-        worker.finished.connect(self._on_vault_locked)
-        worker.error.connect(self._on_operation_error)
-        worker.start()
-
-        self._worker = worker
+        self._run_in_background(self.session_manager.lock, self._on_vault_locked)
 
     def _on_vault_locked(self, _):
         """Handle vault lock completion."""
@@ -371,6 +396,33 @@ class MainWindow(QMainWindow):
             self._log(f"Error launching Obsidian: {e}")
             QMessageBox.critical(self, "Error", f"Failed to launch Obsidian:\n\n{e}")
 
+    def _run_in_background(self, func, on_finished, on_progress=None):
+        """
+        Run a blocking operation on the shared thread pool.
+
+        Args:
+            func: Callable to run in the pool
+            on_finished: Slot called with the result on success
+            on_progress: Optional slot for progress messages; if given, func
+                is called with a ``progress`` callable to report them
+
+        Errors are reported through _on_operation_error.
+        """
+        task = VaultTask(func)
+        signals = task.signals
+        signals.finished.connect(on_finished)
+        signals.error.connect(self._on_operation_error)
+
+        if on_progress is not None:
+            task.kwargs["progress"] = signals.progress.emit
+            signals.progress.connect(on_progress)
+
+        self._pending_tasks.add(signals)
+        signals.finished.connect(lambda _: self._pending_tasks.discard(signals))
+        signals.error.connect(lambda _: self._pending_tasks.discard(signals))
+
+        self._thread_pool.start(task)
+
     def _on_operation_error(self, error_msg: str):
         """Handle operation errors."""
         self._hide_progress()
@@ -388,8 +440,16 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
 
     def _log(self, message: str):
-        """Add message to log."""
-        self.log_text.append(message)
+        """Queue message for the log view."""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued log messages in a single update."""
+        if self._log_buffer:
+            self.log_text.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def closeEvent(self, event):
         """Handle window close event."""
@@ -406,8 +466,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.Yes:
                 self._lock_vault()
                 # Wait for lock to complete
-                if hasattr(self, "_worker"):
-                    self._worker.wait()
+                self._thread_pool.waitForDone()
                 event.accept()
             elif reply == QMessageBox.StandardButton.No:
                 # Clean up resources without locking
@@ -2,12 +2,20 @@
 Tree widget for displaying vault structure.
 """
 
+from collections import defaultdict
+
 from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 
 from ..vault import VaultIndex, IndexNode
 
+# Display prefix for each node type
+_ICON_PREFIX = {
+    "folder": "📁 ",
+    "file": "📄 ",
+}
+
 
 class VaultTreeWidget(QTreeWidget):
     """Tree widget for displaying encrypted vault structure."""
@@ -32,48 +40,78 @@ class VaultTreeWidget(QTreeWidget):
         self.index = index
         self.node_items.clear()
 
-        # Build tree from root nodes (nodes with no parent)
-        root_nodes = [node for node in index.nodes.values() if node.parent_id is None]
+        # Group and sort children once instead of scanning the index per node
+        children_by_parent: dict[str | None, list[IndexNode]] = defaultdict(list)
+        for node in index.nodes.values():
+            children_by_parent[node.parent_id].append(node)
+        for children in children_by_parent.values():
+            children.sort(key=lambda n: (n.node_type, n.name))
 
-        for node in root_nodes:
-            self._add_node_recursive(node)
+        # Build tree from root nodes (nodes with no parent)
+        root_nodes = children_by_parent.get(None, [])
+
+        # Build detached items and attach them in one batch so the view
+        # is invalidated once rather than per inserted node
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.addTopLevelItems(self._build_items(root_nodes, children_by_parent))
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
         self.expandAll()
 
-    def _add_node_recursive(self, node: IndexNode, parent_item: QTreeWidgetItem | None = None):
+    def _build_items(
+        self,
+        root_nodes: list[IndexNode],
+        children_by_parent: dict[str | None, list[IndexNode]],
+    ) -> list[QTreeWidgetItem]:
         """
-        Recursively add a node and its children to the tree.
+        Build detached tree items for the given roots and all descendants.
+
+        Uses an explicit stack rather than recursion, so deeply nested
+        vaults cannot hit the recursion limit.
 
         Args:
-            node: Node to add
-            parent_item: Parent tree item (None for root)
+            root_nodes: Nodes to build as top-level items
+            children_by_parent: Sorted children keyed by parent node ID
+
+        Returns:
+            list[QTreeWidgetItem]: Top-level items with descendants attached
         """
-        # Create tree item
-        if parent_item is None:
-            item = QTreeWidgetItem(self)
-        else:
-            item = QTreeWidgetItem(parent_item)
-
-        # Set node name
-        item.setText(0, node.name)
-
-        # Set icon based on type
-        if node.node_type == "folder":
-            item.setText(0, f"📁 {node.name}")
-        else:
-            item.setText(0, f"📄 {node.name}")
-
-        # Store node ID in item data
-        item.setData(0, Qt.ItemDataRole.UserRole, node.node_id)
-
-        # Store item reference
-        self.node_items[node.node_id] = item
-
-        # Add children
-        if self.index:
-            children = self.index.get_children(node.node_id)
-            for child in sorted(children, key=lambda n: (n.node_type, n.name)):
-                self._add_node_recursive(child, item)
+        user_role = Qt.ItemDataRole.UserRole
+        icon_prefix = _ICON_PREFIX
+        node_items = self.node_items
+        roots: list[QTreeWidgetItem] = []
+
+        # Push in reverse so siblings are popped (and appended) in sorted order
+        stack: list[tuple[IndexNode, QTreeWidgetItem | None]] = [
+            (node, None) for node in reversed(root_nodes)
+        ]
+
+        while stack:
+            node, parent_item = stack.pop()
+
+            # Set display text with an icon based on type
+            item = QTreeWidgetItem([icon_prefix.get(node.node_type, "📄 ") + node.name])
+
+            # Store node ID in item data
+            item.setData(0, user_role, node.node_id)
+
+            # Store item reference
+            node_items[node.node_id] = item
+
+            if parent_item is None:
+                roots.append(item)
+            else:
+                parent_item.addChild(item)
+
+            children = children_by_parent.get(node.node_id)
+            if children:
+                stack.extend((child, item) for child in reversed(children))
+
+        return roots
 
     def get_selected_node_id(self) -> str | None:
         """
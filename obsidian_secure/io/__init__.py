@@ -2,11 +2,14 @@
 I/O utilities for secure file operations.
 """
 
-from .atomic import atomic_write
-from .secure_delete import secure_delete_file, secure_delete_directory
+from .atomic import atomic_write, atomic_write_stream, atomic_open
+from .secure_delete import secure_delete_file, secure_delete_directory, is_memory_backed
 
 __all__ = [
     "atomic_write",
+    "atomic_write_stream",
+    "atomic_open",
     "secure_delete_file",
     "secure_delete_directory",
+    "is_memory_backed",
 ]
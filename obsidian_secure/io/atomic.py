@@ -4,7 +4,44 @@ Atomic file write operations to prevent corruption.
 
 import os
 import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+# Parent directories already created by this process; skips the per-write
+# mkdir stat walk. Stale entries are recovered from in _mkstemp_in.
+_ENSURED_DIRS: set[str] = set()
+_ENSURED_DIRS_MAX = 4096
+_ENSURED_DIRS_LOCK = threading.Lock()
+
+
+def _ensure_parent(parent: Path) -> None:
+    """Create parent (and ancestors) unless already known to exist."""
+    key = str(parent)
+    if key in _ENSURED_DIRS:
+        return
+
+    parent.mkdir(parents=True, exist_ok=True)
+    with _ENSURED_DIRS_LOCK:
+        if len(_ENSURED_DIRS) >= _ENSURED_DIRS_MAX:
+            _ENSURED_DIRS.clear()
+        _ENSURED_DIRS.add(key)
+
+
+def _mkstemp_in(file_path: Path) -> tuple[int, str]:
+    """Create the temporary file next to file_path."""
+    parent = file_path.parent
+    _ensure_parent(parent)
+
+    try:
+        return tempfile.mkstemp(dir=parent, prefix=".tmp_", suffix=file_path.suffix)
+    except FileNotFoundError:
+        # Directory was removed since it was cached; recreate and retry
+        with _ENSURED_DIRS_LOCK:
+            _ENSURED_DIRS.discard(str(parent))
+        _ensure_parent(parent)
+        return tempfile.mkstemp(dir=parent, prefix=".tmp_", suffix=file_path.suffix)
 
 
 def atomic_write(file_path: str | Path, data: bytes) -> None:
@@ -17,35 +54,83 @@ def atomic_write(file_path: str | Path, data: bytes) -> None:
         file_path: Target file path
         data: Data to write
 
+    Raises:
+        OSError: If write or rename fails
+    """
+    atomic_write_stream(file_path, (data,))
+
+
+def atomic_write_stream(file_path: str | Path, chunks: Iterable[bytes]) -> None:
+    """
+    Write a sequence of chunks to a file atomically using write-then-rename.
+
+    Lets producers such as streaming encryption write large payloads
+    without first building the whole file in memory.
+
+    Args:
+        file_path: Target file path
+        chunks: Iterable of bytes-like chunks, written in order
+
     Raises:
         OSError: If write or rename fails
     """
     file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create temporary file in the same directory to ensure same filesystem
-    fd, temp_path = tempfile.mkstemp(
-        dir=file_path.parent,
-        prefix=".tmp_",
-        suffix=file_path.suffix
-    )
+    fd, temp_path = _mkstemp_in(file_path)
+
+    try:
+        # Write data straight to the descriptor, bypassing buffered IO
+        try:
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            os.fsync(fd)  # Force write to disk
+        finally:
+            os.close(fd)
+
+        # Atomic rename (os.replace overwrites the target on all platforms)
+        os.replace(temp_path, file_path)
+
+    except Exception:
+        # Clean up temporary file on error
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def atomic_open(file_path: str | Path) -> Iterator[BinaryIO]:
+    """
+    Open a file for atomic writing as a binary stream.
+
+    Data written to the yielded file goes to a temporary file in the same
+    directory, which replaces ``file_path`` (after fsync) only if the block
+    exits without an exception; otherwise it is removed.
+
+    Args:
+        file_path: Target file path
+
+    Yields:
+        BinaryIO: Writable binary file object
+
+    Raises:
+        OSError: If write or rename fails
+    """
+    file_path = Path(file_path)
+    fd, temp_path = _mkstemp_in(file_path)
 
     try:
-        # Write data to temporary file
-        with os.fdopen(fd, 'wb') as f:
-            f.write(data)
+        with os.fdopen(fd, "wb") as f:
+            yield f
             f.flush()
             os.fsync(f.fileno())  # Force write to disk
 
-        # Atomic rename (Windows: replace existing file)
-        if os.name == 'nt':  # Windows
-            # On Windows, we need to remove the target first if it exists
-            if file_path.exists():
-                os.replace(temp_path, file_path)
-            else:
-                os.rename(temp_path, file_path)
-        else:  # Unix-like
-            os.rename(temp_path, file_path)
+        os.replace(temp_path, file_path)
 
     except Exception:
         # Clean up temporary file on error
@@ -3,17 +3,147 @@ Secure file and directory deletion with overwriting.
 """
 
 import os
-import shutil
+import re
+import sys
+import errno
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ..config import SECURE_DELETE_PASSES
+from typing import Iterator
+from ..config import SECURE_DELETE_PASSES, SECURE_DELETE_ZERO_PASS, SECURE_DELETE_WORKERS
 
+# Child of the application logger so setup_logging handlers apply
+logger = logging.getLogger("ObsidianSecure.secure_delete")
 
-def secure_delete_file(file_path: str | Path) -> None:
+_OVERWRITE_CHUNK_SIZE = 1 << 20  # 1 MiB
+_ZERO_CHUNK = bytes(_OVERWRITE_CHUNK_SIZE)
+_DELETE_ROUNDS = 3  # Overwrite-then-rmdir attempts before giving up on a directory
+
+
+_zero_fd: int | None = None
+_zero_fd_lock = threading.Lock()
+
+
+def _get_zero_fd() -> int:
+    """Return a shared read-only /dev/zero descriptor, opening it on first use."""
+    global _zero_fd
+
+    with _zero_fd_lock:
+        if _zero_fd is None:
+            # Not inherited by child processes such as Obsidian
+            _zero_fd = os.open("/dev/zero", os.O_RDONLY | os.O_CLOEXEC)
+            atexit.register(_close_zero_fd)
+        return _zero_fd
+
+
+def _close_zero_fd() -> None:
+    """Close the shared /dev/zero descriptor if it was opened."""
+    global _zero_fd
+
+    with _zero_fd_lock:
+        if _zero_fd is not None:
+            os.close(_zero_fd)
+            _zero_fd = None
+
+
+def _sendfile_zeros(fd: int, file_size: int) -> bool:
+    """
+    Overwrite the first file_size bytes of fd by copying from /dev/zero.
+
+    The kernel supplies the zeros, so no userspace buffer is written.
+
+    Returns:
+        bool: False if unsupported on this platform (nothing written)
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "sendfile"):
+        return False
+
+    try:
+        zero_fd = _get_zero_fd()
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        remaining = file_size
+        while remaining > 0:
+            sent = os.sendfile(fd, zero_fd, None, remaining)
+            if sent == 0:
+                return False
+            remaining -= sent
+    except OSError:
+        return False
+
+    return True
+
+
+# Filesystems whose contents live only in RAM
+_MEMORY_FS_TYPES = frozenset({"tmpfs", "ramfs"})
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+def is_memory_backed(path: str | Path) -> bool:
+    """
+    Check whether path is on a RAM-backed filesystem (tmpfs/ramfs).
+
+    Only detected on Linux, via /proc/self/mounts; returns False elsewhere
+    or if the mount table cannot be read.
+
+    Args:
+        path: Existing file or directory
+
+    Returns:
+        bool: True if the longest matching mount point is tmpfs or ramfs
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    target = os.path.realpath(path)
+    best_mount, best_type = "", ""
+
+    try:
+        with open("/proc/self/mounts", encoding="utf-8") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Mount points escape spaces and other characters as octal
+                mount_point = _OCTAL_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), fields[1])
+                prefix = mount_point.rstrip("/") + "/"
+                if (target == mount_point or target.startswith(prefix)) and len(mount_point) >= len(best_mount):
+                    best_mount, best_type = mount_point, fields[2]
+    except OSError:
+        return False
+
+    return best_type in _MEMORY_FS_TYPES
+
+
+def _overwrite(f, file_size: int, random: bool) -> None:
+    """Overwrite the first file_size bytes of f in fixed-size chunks."""
+    if not random and _sendfile_zeros(f.fileno(), file_size):
+        os.fsync(f.fileno())
+        return
+
+    f.seek(0)
+    remaining = file_size
+    while remaining > 0:
+        chunk_len = min(_OVERWRITE_CHUNK_SIZE, remaining)
+        if random:
+            f.write(os.urandom(chunk_len))
+        else:
+            f.write(memoryview(_ZERO_CHUNK)[:chunk_len])
+        remaining -= chunk_len
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def secure_delete_file(file_path: str | Path, size: int | None = None) -> None:
     """
     Securely delete a file by overwriting it before deletion.
 
     Args:
         file_path: Path to file to delete
+        size: File size if already known (skips the existence and type
+            checks, which cost a stat each)
 
     Note:
         On SSDs with wear leveling, this may not guarantee complete erasure,
@@ -21,39 +151,89 @@ def secure_delete_file(file_path: str | Path) -> None:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        return
+    if size is None:
+        if not file_path.exists():
+            return
+
+        if not file_path.is_file():
+            raise ValueError(f"{file_path} is not a file")
 
-    if not file_path.is_file():
-        raise ValueError(f"{file_path} is not a file")
+        size = file_path.stat().st_size
 
-    file_size = file_path.stat().st_size
+    file_size = size
 
     try:
         # Overwrite file multiple times
         with open(file_path, 'r+b') as f:
             for _ in range(SECURE_DELETE_PASSES):
-                f.seek(0)
                 # Write random data
-                f.write(os.urandom(file_size))
-                f.flush()
-                os.fsync(f.fileno())
+                _overwrite(f, file_size, random=True)
 
             # Final pass with zeros
-            f.seek(0)
-            f.write(b'\x00' * file_size)
-            f.flush()
-            os.fsync(f.fileno())
+            if SECURE_DELETE_ZERO_PASS:
+                _overwrite(f, file_size, random=False)
+
+            # Drop the overwritten pages from the page cache where supported
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, file_size, os.POSIX_FADV_DONTNEED)
 
     finally:
         # Delete the file
         file_path.unlink(missing_ok=True)
 
 
+def _iter_files(dir_path: str) -> Iterator[tuple[str, int | None]]:
+    """
+    Yield (path, size) for every non-directory entry below dir_path.
+
+    Sizes come from the scandir entry, so no extra stat is needed later.
+    Symlinks and other non-regular entries are not followed and are
+    yielded with a size of None.
+    """
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path, entry.stat(follow_symlinks=False).st_size
+            else:
+                yield entry.path, None
+
+
+def _remove_empty_dirs(dir_path: str) -> bool:
+    """
+    Remove dir_path and its subdirectories bottom-up with os.rmdir.
+
+    Unlike shutil.rmtree this never unlinks a file, so anything created
+    after the files were overwritten is left in place.
+
+    Returns:
+        bool: False if a directory was not empty and was kept
+    """
+    with os.scandir(dir_path) as entries:
+        subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+
+    for subdir in subdirs:
+        _remove_empty_dirs(subdir)
+
+    try:
+        os.rmdir(dir_path)
+    except OSError as e:
+        if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+            return False
+        raise
+
+    return True
+
+
 def secure_delete_directory(dir_path: str | Path) -> None:
     """
     Securely delete a directory and all its contents.
 
+    Files that appear while the directory is being deleted (e.g. written
+    by a still-running Obsidian) are overwritten in a further round
+    rather than unlinked as is.
+
     Args:
         dir_path: Path to directory to delete
 
@@ -68,49 +248,49 @@ def secure_delete_directory(dir_path: str | Path) -> None:
     if not dir_path.is_dir():
         raise ValueError(f"{dir_path} is not a directory")
 
-    failed_files = []
-
-    # Recursively delete all files
-    for root, dirs, files in os.walk(dir_path, topdown=False):
-        root_path = Path(root)
-
-        # Securely delete all files
-        for name in files:
-            file_path = root_path / name
-            try:
-                secure_delete_file(file_path)
-            except Exception as e:
-                # Track failed files
-                failed_files.append((file_path, str(e)))
-                print(f"Warning: Failed to securely delete {file_path}: {e}")
-
-        # Remove empty directories
-        for name in dirs:
-            dir_to_remove = root_path / name
-            try:
-                dir_to_remove.rmdir()
-            except OSError:
-                pass
-
-    # If some files failed, raise an error
-    if failed_files:
-        error_msg = f"Failed to delete {len(failed_files)} file(s). They may be locked by another process:\n"
-        for file_path, error in failed_files[:5]:  # Show first 5
-            error_msg += f"  - {file_path.name}: {error}\n"
-        if len(failed_files) > 5:
-            error_msg += f"  ... and {len(failed_files) - 5} more\n"
-        error_msg += "\nPlease close Obsidian and any other programs that may have these files open, then try locking again."
-        raise OSError(error_msg)
-
-    # Remove the root directory
-    try:
-        dir_path.rmdir()
-    except OSError as e:
-        # If rmdir fails, try shutil.rmtree as fallback
+    def delete(entry: tuple[str, int | None]) -> tuple[str, str] | None:
+        file_path, size = entry
+        try:
+            if size is None:
+                # Remove links without touching their targets
+                os.unlink(file_path)
+            else:
+                secure_delete_file(file_path, size)
+        except Exception as e:
+            logger.warning("Failed to securely delete %s: %s", file_path, e)
+            return file_path, str(e)
+        return None
+
+    for _ in range(_DELETE_ROUNDS):
+        # Collect every file (with its size) before deleting anything
+        all_files = list(_iter_files(str(dir_path)))
+
+        # Overwrite files in parallel so per-file fsync stalls overlap
+        with ThreadPoolExecutor(max_workers=SECURE_DELETE_WORKERS) as executor:
+            failed_files = [result for result in executor.map(delete, all_files) if result]
+
+        # If some files failed, raise an error
+        if failed_files:
+            error_msg = f"Failed to delete {len(failed_files)} file(s). They may be locked by another process:\n"
+            for file_path, error in failed_files[:5]:  # Show first 5
+                error_msg += f"  - {os.path.basename(file_path)}: {error}\n"
+            if len(failed_files) > 5:
+                error_msg += f"  ... and {len(failed_files) - 5} more\n"
+            error_msg += "\nPlease close Obsidian and any other programs that may have these files open, then try locking again."
+            raise OSError(error_msg)
+
+        # Only empty directories should remain; a non-empty one means
+        # files were created meanwhile, which the next round overwrites
         try:
-            shutil.rmtree(dir_path, ignore_errors=False)
-        except Exception as e2:
+            if _remove_empty_dirs(str(dir_path)):
+                return
+        except OSError as e:
             raise OSError(
                 f"Failed to delete workspace directory: {e}\n"
                 f"Please close Obsidian and try again."
-            ) from e2
+            ) from e
+
+    raise OSError(
+        f"Files kept appearing in {dir_path} while it was being deleted.\n"
+        f"Please close Obsidian and try again."
+    )
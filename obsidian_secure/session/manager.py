@@ -4,24 +4,35 @@ Session manager for coordinating vault unlock/lock operations.
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from ..crypto import (
-    derive_master_key,
+    derive_master_key_into,
     derive_vault_key,
     derive_file_key,
     encrypt_data,
-    decrypt_data,
     read_encrypted_file,
+    open_and_decrypt,
     create_encrypted_file,
+    secure_zero,
 )
 from ..vault import VaultIndex, VaultLayout
 from ..io import atomic_write
-from ..config import OBSIDIAN_EXECUTABLE
+from ..config import AES_KEY_SIZE, OBSIDIAN_EXECUTABLE, SESSION_WORKERS
 from .workspace import Workspace
 from .watcher import FileWatcher
 
+# Maps the native separator to "/" for index paths (None where it already is "/")
+_SEP_TRANS = str.maketrans(os.sep, "/") if os.sep != "/" else None
+
+
+def _index_path(file_path: Path) -> str:
+    """Convert a workspace-relative path to an index path string."""
+    path_str = str(file_path)
+    return path_str.translate(_SEP_TRANS) if _SEP_TRANS else path_str
+
 
 class SessionManager:
     """Manages unlock/lock sessions for encrypted vaults."""
@@ -38,11 +49,14 @@ class SessionManager:
         self.workspace: Optional[Workspace] = None
         self.index: Optional[VaultIndex] = None
         self.vault_key: Optional[bytes] = None
-        self.master_key: Optional[bytes] = None
+        self.master_key: Optional[bytearray] = None
         self.salt: Optional[bytes] = None
         self.watcher: Optional[FileWatcher] = None
         self.vault_id: Optional[str] = None
 
+        # File keys derived once per session, keyed by node ID
+        self.file_keys: dict[str, bytes] = {}
+
     def unlock(self, password: str) -> Workspace:
         """
         Unlock the vault and create a workspace.
@@ -67,8 +81,11 @@ class SessionManager:
         index_path = self.layout.get_index_path()
         enc_index = read_encrypted_file(str(index_path))
 
-        # Derive master key from password
-        self.master_key, self.salt = derive_master_key(password, enc_index.salt)
+        # Derive master key from password straight into a buffer that is
+        # wiped on lock, so no unwipeable bytes copy of it exists
+        self.salt = enc_index.salt
+        self.master_key = bytearray(AES_KEY_SIZE)
+        derive_master_key_into(password, self.salt, self.master_key)
 
         # Derive vault key
         self.vault_key = derive_vault_key(self.master_key, self.vault_id)
@@ -81,6 +98,8 @@ class SessionManager:
                 enc_index.nonce
             )
         except Exception as e:
+            # Wipe the key material derived from the rejected password
+            self._clear_sensitive_data()
             raise ValueError(f"Failed to decrypt vault (incorrect password?): {e}")
 
         # Create workspace
@@ -90,14 +109,10 @@ class SessionManager:
         # Build folder structure
         self.workspace.build_tree(self.index)
 
-        # Decrypt all files
-        for node in self.index.nodes.values():
-            if node.node_type == "file":
-                self._decrypt_file_to_workspace(node.node_id)
-
-        # Track initial file hashes
-        for file_path in self.workspace.list_files():
-            self.workspace.track_file(file_path)
+        # Decrypt all files, tracking their hashes as they are written
+        file_ids = [node.node_id for node in self.index.nodes.values() if node.node_type == "file"]
+        self.file_keys = {node_id: derive_file_key(self.vault_key, node_id) for node_id in file_ids}
+        self._run_parallel(self._decrypt_file_to_workspace, file_ids)
 
         # Start file watcher
         self.watcher = FileWatcher(self.workspace.workspace_path)
@@ -118,45 +133,64 @@ class SessionManager:
         if self.watcher:
             self.watcher.stop()
 
+        # Files the watcher saw change. Events still in flight when the
+        # watcher stopped are caught by the mtime/size check below.
+        dirty = set(self.watcher.get_changed_files()) if self.watcher else set()
+
         # Get ALL files currently in workspace
         all_files = self.workspace.list_files()
 
-        # Process all files (new, modified, or unchanged)
+        # Hash tracked files that may have changed up front, in parallel
+        file_hashes = self.workspace.file_hashes
+        tracked_files = [
+            f for f in all_files
+            if str(f) in file_hashes and (f in dirty or self.workspace.stat_changed(f))
+        ]
+        current_hashes = dict(
+            zip(tracked_files, self.workspace.compute_file_hashes(tracked_files))
+        )
+
+        # Process all files (new, modified, or unchanged). Index changes are
+        # made serially; the encryption itself runs in parallel afterwards.
+        to_encrypt = []
+        folder_index = self._build_folder_index()
+        path_index = self.index.build_path_index()
+        workspace_file_paths = set()
         for file_path in all_files:
             # Convert to path string with forward slashes
-            full_path = str(file_path).replace(os.sep, "/")
+            full_path = _index_path(file_path)
+            workspace_file_paths.add(full_path)
 
             # Check if file exists in index
-            node_id = self.index.find_by_path(full_path)
+            node_id = path_index.get(full_path)
 
             if node_id:
                 # Existing file - check if modified
-                tracked_hash = self.workspace.file_hashes.get(str(file_path))
+                tracked_hash = file_hashes.get(str(file_path))
                 if tracked_hash:
-                    current_hash = self.workspace.compute_file_hash(file_path)
-                    if current_hash != tracked_hash:
+                    if file_path not in current_hashes:
+                        # Unchanged per watcher and metadata - skip re-encryption
+                        continue
+                    if current_hashes[file_path] != tracked_hash:
                         # File was modified - re-encrypt it
-                        self._encrypt_file_from_workspace(node_id)
+                        to_encrypt.append(node_id)
                 else:
                     # File wasn't tracked (shouldn't happen, but re-encrypt to be safe)
-                    self._encrypt_file_from_workspace(node_id)
+                    to_encrypt.append(node_id)
             else:
                 # NEW file - add to index and encrypt
-                self._add_new_file_to_vault(file_path)
+                to_encrypt.append(self._add_new_file_to_index(file_path, folder_index))
 
-        # Handle deleted files (in index but not in workspace)
-        workspace_file_paths = set(str(f).replace(os.sep, "/") for f in all_files)
+        self._run_parallel(self._encrypt_file_from_workspace, to_encrypt)
 
-        for node_id, node in list(self.index.nodes.items()):
-            if node.node_type == "file":
-                node_path = self.index.get_path(node_id)
-
-                if node_path not in workspace_file_paths:
-                    # File was deleted - remove from index and vault
-                    enc_file_path = self.layout.get_encrypted_file_path(node_id)
-                    if enc_file_path.exists():
-                        enc_file_path.unlink()
-                    self.index.remove_node(node_id)
+        # Handle deleted files (in index but not in workspace)
+        for node_path in path_index.keys() - workspace_file_paths:
+            # File was deleted - remove from index and vault
+            node_id = path_index[node_path]
+            enc_file_path = self.layout.get_encrypted_file_path(node_id)
+            if enc_file_path.exists():
+                enc_file_path.unlink()
+            self.index.remove_node(node_id)
 
         # Save updated index
         if self.index and self.vault_key and self.salt:
@@ -169,6 +203,47 @@ class SessionManager:
         # Clear sensitive data
         self._clear_sensitive_data()
 
+    @staticmethod
+    def _run_parallel(func: Callable[[str], None], node_ids: Iterable[str]) -> None:
+        """
+        Apply func to every node ID on a thread pool.
+
+        OpenSSL releases the GIL during AES-GCM, and file IO releases it
+        too, so per-file work scales across cores.
+
+        Args:
+            func: Per-file operation taking a node ID
+            node_ids: Node IDs to process
+
+        Raises:
+            Exception: The first exception raised by func
+        """
+        node_ids = list(node_ids)
+        if len(node_ids) < 2 or SESSION_WORKERS <= 1:
+            for node_id in node_ids:
+                func(node_id)
+            return
+
+        with ThreadPoolExecutor(max_workers=SESSION_WORKERS) as executor:
+            # Consume the results so worker exceptions propagate
+            for _ in executor.map(func, node_ids):
+                pass
+
+    def _get_file_key(self, node_id: str) -> bytes:
+        """
+        Get the key for a file, deriving it for files added this session.
+
+        Args:
+            node_id: File node ID
+
+        Returns:
+            bytes: 256-bit file key
+        """
+        file_key = self.file_keys.get(node_id)
+        if file_key is None:
+            file_key = self.file_keys[node_id] = derive_file_key(self.vault_key, node_id)
+        return file_key
+
     def _decrypt_file_to_workspace(self, node_id: str) -> None:
         """
         Decrypt a file and write it to the workspace.
@@ -186,16 +261,16 @@ class SessionManager:
             # File doesn't exist yet (new file in index)
             return
 
-        enc_file = read_encrypted_file(str(enc_file_path))
+        file_key = self._get_file_key(node_id)
 
-        # Derive file key
-        file_key = derive_file_key(self.vault_key, node_id)
+        # Read, parse and decrypt in one pass
+        plaintext = open_and_decrypt(enc_file_path, file_key)
 
-        # Decrypt
-        plaintext = decrypt_data(enc_file.ciphertext, file_key, enc_file.nonce)
-
-        # Write to workspace
-        self.workspace.write_file(self.index, node_id, plaintext)
+        # Write to workspace, then wipe the plaintext buffer
+        try:
+            self.workspace.write_file(self.index, node_id, plaintext, track=True)
+        finally:
+            secure_zero(plaintext)
 
     def _encrypt_file_from_workspace(self, node_id: str) -> None:
         """
@@ -210,15 +285,13 @@ class SessionManager:
         # Read from workspace
         plaintext = self.workspace.read_file(self.index, node_id)
 
-        # Derive file key
-        file_key = derive_file_key(self.vault_key, node_id)
+        file_key = self._get_file_key(node_id)
 
         # Encrypt
         ciphertext, nonce = encrypt_data(plaintext, file_key)
 
         # Create encrypted file
         enc_file = create_encrypted_file(
-            plaintext=plaintext,
             file_id=node_id,
             file_type="file",
             ciphertext=ciphertext,
@@ -230,29 +303,49 @@ class SessionManager:
         enc_file_path = self.layout.get_encrypted_file_path(node_id)
         atomic_write(enc_file_path, enc_file.to_bytes())
 
-    def _add_new_file_to_vault(self, file_path: Path) -> None:
+    def _build_folder_index(self) -> dict[tuple[str, str], str]:
         """
-        Add a new file to the vault (created during session).
+        Map (parent_id, name) to node ID for every folder in the index.
+
+        Returns:
+            dict: Folder lookup used by _add_new_file_to_index
+        """
+        return {
+            (node.parent_id, node.name): node.node_id
+            for node in self.index.nodes.values()
+            if node.node_type == "folder"
+        }
+
+    def _add_new_file_to_index(
+        self,
+        file_path: Path,
+        folder_index: dict[tuple[str, str], str] | None = None,
+    ) -> str:
+        """
+        Add a new file (created during session) and its folders to the index.
+
+        The caller is responsible for encrypting the file.
 
         Args:
             file_path: Relative path to the new file in workspace
+            folder_index: Folder lookup from _build_folder_index, updated in
+                place with created folders (built on demand if None)
+
+        Returns:
+            str: Node ID of the new file
         """
         if self.vault_key is None or self.workspace is None or self.index is None:
             raise RuntimeError("Session not initialized")
 
         # Convert path to string with forward slashes
-        path_str = str(file_path).replace(os.sep, "/")
+        path_str = _index_path(file_path)
 
         # Parse path to find parent folder
         parts = path_str.split("/")
         filename = parts[-1]
 
         # Find the root folder (node with parent_id=None)
-        root_id = None
-        for node in self.index.nodes.values():
-            if node.parent_id is None:
-                root_id = node.node_id
-                break
+        root_id = self.index.get_root_id()
 
         if root_id is None:
             raise RuntimeError("No root folder found in index")
@@ -260,50 +353,48 @@ class SessionManager:
         # Find or create parent folder in index
         parent_id = root_id  # Start from root folder
         if len(parts) > 1:
+            if folder_index is None:
+                folder_index = self._build_folder_index()
+
             # Navigate through folder structure
             current_id = root_id
             for folder_name in parts[:-1]:
                 # Try to find existing folder
-                found_id = None
-                for node in self.index.nodes.values():
-                    if (node.parent_id == current_id and
-                        node.name == folder_name and
-                        node.node_type == "folder"):
-                        found_id = node.node_id
-                        break
+                found_id = folder_index.get((current_id, folder_name))
 
                 if found_id:
                     current_id = found_id
                 else:
                     # Create new folder
+                    parent_key = (current_id, folder_name)
                     current_id = self.index.add_node(
                         name=folder_name,
                         node_type="folder",
                         parent_id=current_id
                     )
+                    folder_index[parent_key] = current_id
 
             parent_id = current_id
 
         # Add file to index
-        node_id = self.index.add_node(
+        return self.index.add_node(
             name=filename,
             node_type="file",
             parent_id=parent_id
         )
 
-        # Encrypt and save the file
-        self._encrypt_file_from_workspace(node_id)
-
     def _clear_sensitive_data(self) -> None:
         """Clear sensitive data from memory (best-effort)."""
-        if self.master_key:
-            # Overwrite with zeros
-            for i in range(len(self.master_key)):
-                self.master_key = None
+        if self.master_key is not None:
+            # Overwrite with zeros in place
+            secure_zero(self.master_key)
+            self.master_key = None
 
         if self.vault_key:
             self.vault_key = None
 
+        self.file_keys.clear()
+
         self.workspace = None
         self.index = None
         self.salt = None
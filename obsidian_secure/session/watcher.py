@@ -2,12 +2,19 @@
 File watcher for monitoring workspace changes.
 """
 
+import os
+import threading
 import time
 from pathlib import Path
-from typing import Callable, Set
+from typing import Callable, Dict, Set
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from ..config import OBSIDIAN_CONFIG_FOLDER
+
+# Events for the same file closer together than this are coalesced
+_DEBOUNCE_SECONDS = 0.1
+
 
 class FileWatcher:
     """Monitors workspace for file changes."""
@@ -25,6 +32,14 @@ class FileWatcher:
         self.observer: Observer | None = None
         self.changed_files: Set[Path] = set()
 
+        # Relative path -> monotonic time of the latest event, awaiting flush
+        self._pending: Dict[str, float] = {}
+        # Guards both _pending and changed_files against the flush thread
+        self._pending_lock = threading.Lock()
+        self._prefix = str(workspace_path) + os.sep
+        self._stop_event = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+
     def start(self) -> None:
         """Start monitoring the workspace."""
         if self.observer is not None:
@@ -35,6 +50,10 @@ class FileWatcher:
         self.observer.schedule(event_handler, str(self.workspace_path), recursive=True)
         self.observer.start()
 
+        self._stop_event.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+
     def stop(self) -> None:
         """Stop monitoring the workspace."""
         if self.observer is not None:
@@ -42,6 +61,13 @@ class FileWatcher:
             self.observer.join(timeout=5)
             self.observer = None
 
+        if self._flush_thread is not None:
+            self._stop_event.set()
+            self._flush_thread.join(timeout=5)
+            self._flush_thread = None
+
+        self._flush(force=True)
+
     def get_changed_files(self) -> list[Path]:
         """
         Get list of files that have changed.
@@ -49,33 +75,70 @@ class FileWatcher:
         Returns:
             list[Path]: List of changed file paths relative to workspace
         """
-        return list(self.changed_files)
+        self._flush(force=True)
+        with self._pending_lock:
+            return list(self.changed_files)
 
     def clear_changes(self) -> None:
         """Clear the list of changed files."""
-        self.changed_files.clear()
+        with self._pending_lock:
+            self._pending.clear()
+            self.changed_files.clear()
 
-    def _on_file_changed(self, file_path: Path) -> None:
+    def _on_file_changed(self, file_path: str | Path) -> None:
         """
         Internal callback when a file changes.
 
+        Only records the event; repeated events for the same file are
+        coalesced and reported once by _flush.
+
         Args:
             file_path: Absolute path to changed file
         """
+        file_path = os.fspath(file_path)
+
         # Convert to relative path
-        try:
-            relative_path = file_path.relative_to(self.workspace_path)
-        except ValueError:
+        if not file_path.startswith(self._prefix):
             return  # Not in workspace
+        relative_path = file_path[len(self._prefix):]
 
         # Skip Obsidian config files
-        if ".obsidian" in relative_path.parts:
+        if OBSIDIAN_CONFIG_FOLDER in relative_path.split(os.sep):
             return
 
-        self.changed_files.add(relative_path)
+        with self._pending_lock:
+            self._pending[relative_path] = time.monotonic()
+
+    def _flush_loop(self) -> None:
+        """Periodically flush settled events until stopped."""
+        while not self._stop_event.wait(_DEBOUNCE_SECONDS):
+            self._flush()
 
+    def _flush(self, force: bool = False) -> None:
+        """
+        Move settled pending events into changed_files.
+
+        Args:
+            force: Flush every pending event regardless of age
+        """
+        cutoff = time.monotonic() - _DEBOUNCE_SECONDS
+
+        with self._pending_lock:
+            if force:
+                settled = list(self._pending)
+                self._pending.clear()
+            else:
+                settled = [path for path, last in self._pending.items() if last <= cutoff]
+                for path in settled:
+                    del self._pending[path]
+
+            settled = [Path(path) for path in settled]
+            self.changed_files.update(settled)
+
+        # Callbacks run outside the lock so they may call back into the watcher
         if self.on_change:
-            self.on_change(relative_path)
+            for relative_path in settled:
+                self.on_change(relative_path)
 
 
 class WorkspaceEventHandler(FileSystemEventHandler):
@@ -94,14 +157,20 @@ class WorkspaceEventHandler(FileSystemEventHandler):
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
         if not event.is_directory:
-            self.watcher._on_file_changed(Path(event.src_path))
+            self.watcher._on_file_changed(event.src_path)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
         if not event.is_directory:
-            self.watcher._on_file_changed(Path(event.src_path))
+            self.watcher._on_file_changed(event.src_path)
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion events."""
         if not event.is_directory:
-            self.watcher._on_file_changed(Path(event.src_path))
+            self.watcher._on_file_changed(event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file rename events (e.g. editors saving via a temp file)."""
+        if not event.is_directory:
+            self.watcher._on_file_changed(event.src_path)
+            self.watcher._on_file_changed(event.dest_path)
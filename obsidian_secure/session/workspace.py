@@ -2,13 +2,21 @@
 Temporary decrypted workspace management.
 """
 
+import os
 import uuid
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
-
-from ..config import WORKSPACE_BASE, WORKSPACE_PREFIX, MARKDOWN_EXT, OBSIDIAN_CONFIG_FOLDER
-from ..io import secure_delete_directory
+from typing import Dict, Iterable
+
+from ..config import (
+    WORKSPACE_BASE,
+    WORKSPACE_PREFIX,
+    MARKDOWN_EXT,
+    OBSIDIAN_CONFIG_FOLDER,
+    HASH_WORKERS,
+)
+from ..io import secure_delete_directory, is_memory_backed
 from ..vault import VaultIndex, IndexNode
 
 
@@ -28,6 +36,8 @@ class Workspace:
         self.workspace_id = workspace_id
         self.workspace_path = WORKSPACE_BASE / f"{WORKSPACE_PREFIX}{workspace_id}"
         self.file_hashes: Dict[str, str] = {}  # Track file hashes for change detection
+        self.file_stats: Dict[str, tuple[int, int]] = {}  # (mtime_ns, size) when tracked
+        self._node_paths: Dict[str, Path] = {}  # Memoized workspace path per node ID
 
     def create(self) -> None:
         """
@@ -45,9 +55,18 @@ class Workspace:
         self._create_obsidian_config()
 
     def destroy(self) -> None:
-        """Securely delete the workspace."""
+        """
+        Securely delete the workspace.
+
+        Workspaces on tmpfs/ramfs are removed directly: their plaintext
+        never reached persistent storage, and overwriting RAM pages that
+        are about to be freed only costs time.
+        """
         if self.workspace_path.exists():
-            secure_delete_directory(self.workspace_path)
+            if is_memory_backed(self.workspace_path):
+                shutil.rmtree(self.workspace_path)
+            else:
+                secure_delete_directory(self.workspace_path)
 
     def exists(self) -> bool:
         """Check if workspace exists."""
@@ -75,7 +94,8 @@ class Workspace:
         Args:
             index: Vault index containing the tree structure
         """
-        # Create all folders first
+        # Create all folders first; paths are memoized so each parent is
+        # resolved once
         for node in index.nodes.values():
             if node.node_type == "folder":
                 folder_path = self._get_node_path(index, node.node_id)
@@ -85,6 +105,10 @@ class Workspace:
         """
         Get the workspace path for a node.
 
+        Paths are memoized per node ID for the lifetime of the workspace,
+        which is valid because nodes are never renamed or moved while a
+        session is unlocked.
+
         Args:
             index: Vault index
             node_id: Node ID
@@ -92,42 +116,77 @@ class Workspace:
         Returns:
             Path: Workspace path for the node
         """
-        node = index.get_node(node_id)
-        if node is None:
+        cached = self._node_paths.get(node_id)
+        if cached is not None:
+            return cached
+
+        if index.get_node(node_id) is None:
             raise ValueError(f"Node {node_id} not found in index")
 
-        # Build path from root, excluding the root folder itself
-        # The workspace directory represents the root folder, so we don't include it in the path
-        parts = []
+        # Walk up to the nearest ancestor with a known path. The workspace
+        # directory represents the root folder, so the root adds no part.
+        names = []
         current_id = node_id
+        base = self.workspace_path
 
         while current_id is not None:
-            current_node = index.nodes[current_id]
+            if current_id in self._node_paths:
+                base = self._node_paths[current_id]
+                break
 
-            # Only add to path if this node has a parent (i.e., not the root folder)
-            if current_node.parent_id is not None:
-                parts.insert(0, current_node.name)
+            current_node = index.nodes[current_id]
+            if current_node.parent_id is None:
+                self._node_paths[current_id] = self.workspace_path
+                break
 
+            names.append((current_id, current_node.name))
             current_id = current_node.parent_id
 
-        if not parts:
-            # This is the root node itself
-            return self.workspace_path
-
-        return self.workspace_path / Path(*parts)
-
-    def write_file(self, index: VaultIndex, node_id: str, content: bytes) -> None:
+        # Descend again, memoizing every intermediate path
+        path = base
+        for current_id, name in reversed(names):
+            path = path / name
+            self._node_paths[current_id] = path
+
+        return path
+
+    def write_file(
+        self,
+        index: VaultIndex,
+        node_id: str,
+        content: bytes | bytearray | memoryview,
+        track: bool = False,
+    ) -> None:
         """
         Write a decrypted file to the workspace.
 
+        The content is written straight from the caller's buffer with
+        os.write, and the file is created readable by the owner only.
+
         Args:
             index: Vault index
             node_id: File node ID
-            content: Decrypted file content
+            content: Decrypted file content (any bytes-like buffer)
+            track: Also track the file for change detection, hashing the
+                in-memory content instead of reading the file back
         """
         file_path = self._get_node_path(index, node_id)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(content)
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+        try:
+            with memoryview(content) as view:
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+        if track:
+            from ..utils import compute_data_hash
+
+            key = str(file_path.relative_to(self.workspace_path))
+            self.file_hashes[key] = compute_data_hash(content)
+            self.file_stats[key] = self._stat_key(file_path)
 
     def read_file(self, index: VaultIndex, node_id: str) -> bytes:
         """
@@ -154,11 +213,20 @@ class Workspace:
             return []
 
         files = []
-        for file_path in self.workspace_path.rglob(f"*{MARKDOWN_EXT}"):
-            # Skip Obsidian config directory
-            if OBSIDIAN_CONFIG_FOLDER in file_path.parts:
-                continue
-            files.append(file_path.relative_to(self.workspace_path))
+        # (directory to scan, its path relative to the workspace)
+        stack = [(str(self.workspace_path), "")]
+
+        while stack:
+            directory, relative_dir = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = relative_dir + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip Obsidian config directory entirely
+                        if entry.name != OBSIDIAN_CONFIG_FOLDER:
+                            stack.append((entry.path, relative + os.sep))
+                    elif entry.name.endswith(MARKDOWN_EXT):
+                        files.append(Path(relative))
 
         return files
 
@@ -170,13 +238,33 @@ class Workspace:
             file_path: Path relative to workspace
 
         Returns:
-            str: SHA-256 hash
+            str: Hex digest of the file contents
         """
         from ..utils import compute_file_hash
 
         full_path = self.workspace_path / file_path
         return compute_file_hash(full_path)
 
+    def compute_file_hashes(self, file_paths: Iterable[Path]) -> list[str]:
+        """
+        Compute hashes of many workspace files in parallel.
+
+        hashlib releases the GIL while hashing, so reads and hashing overlap
+        across threads.
+
+        Args:
+            file_paths: Paths relative to workspace
+
+        Returns:
+            list[str]: Hex digests in input order
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) < 2 or HASH_WORKERS <= 1:
+            return [self.compute_file_hash(file_path) for file_path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            return list(executor.map(self.compute_file_hash, file_paths))
+
     def track_file(self, file_path: Path) -> None:
         """
         Track a file for change detection.
@@ -186,6 +274,48 @@ class Workspace:
         """
         file_hash = self.compute_file_hash(file_path)
         self.file_hashes[str(file_path)] = file_hash
+        self.file_stats[str(file_path)] = self._stat_key(self.workspace_path / file_path)
+
+    def track_files(self, file_paths: Iterable[Path]) -> None:
+        """
+        Track many files for change detection, hashing them in parallel.
+
+        Args:
+            file_paths: Paths relative to workspace
+        """
+        file_paths = list(file_paths)
+        hashes = self.compute_file_hashes(file_paths)
+        self.file_hashes.update(zip(map(str, file_paths), hashes))
+        for file_path in file_paths:
+            self.file_stats[str(file_path)] = self._stat_key(self.workspace_path / file_path)
+
+    @staticmethod
+    def _stat_key(full_path: Path) -> tuple[int, int]:
+        """Return (mtime_ns, size) of a file."""
+        st = os.stat(full_path)
+        return st.st_mtime_ns, st.st_size
+
+    def stat_changed(self, file_path: Path) -> bool:
+        """
+        Check whether a tracked file's mtime or size changed since tracking.
+
+        A cheap pre-check that avoids reading unchanged files; a True
+        result should be confirmed by comparing hashes.
+
+        Args:
+            file_path: Path relative to workspace
+
+        Returns:
+            bool: True if the metadata differs, is unknown, or the file is gone
+        """
+        recorded = self.file_stats.get(str(file_path))
+        if recorded is None:
+            return True
+
+        try:
+            return self._stat_key(self.workspace_path / file_path) != recorded
+        except OSError:
+            return True
 
     def get_modified_files(self) -> list[Path]:
         """
@@ -195,6 +325,7 @@ class Workspace:
             list[Path]: List of modified file paths
         """
         modified = []
+        existing = []
 
         for file_path_str, original_hash in self.file_hashes.items():
             file_path = Path(file_path_str)
@@ -205,7 +336,10 @@ class Workspace:
                 modified.append(file_path)
                 continue
 
-            current_hash = self.compute_file_hash(file_path)
+            existing.append((file_path, original_hash))
+
+        current_hashes = self.compute_file_hashes(file_path for file_path, _ in existing)
+        for (file_path, original_hash), current_hash in zip(existing, current_hashes):
             if current_hash != original_hash:
                 modified.append(file_path)
 
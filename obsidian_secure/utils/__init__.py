@@ -2,10 +2,11 @@
 Utility functions for ObsidianSecure.
 """
 
-from .hashing import compute_file_hash
+from .hashing import compute_file_hash, compute_data_hash
 from .logging import setup_logging
 
 __all__ = [
     "compute_file_hash",
+    "compute_data_hash",
     "setup_logging",
 ]
@@ -3,16 +3,40 @@ File hashing utilities for change detection.
 """
 
 import hashlib
+import threading
 from pathlib import Path
 
+# Read size for hashing; large reads cut syscalls per file
+_HASH_CHUNK_SIZE = 1024 * 1024
 
-def compute_file_hash(file_path: str | Path, algorithm: str = "sha256") -> str:
+# Per-thread reusable read buffer, so hashing allocates nothing per chunk
+_local = threading.local()
+
+
+def _read_buffer() -> memoryview:
+    """Return this thread's reusable read buffer."""
+    view = getattr(_local, "view", None)
+    if view is None:
+        view = _local.view = memoryview(bytearray(_HASH_CHUNK_SIZE))
+    return view
+
+
+def compute_file_hash(file_path: str | Path, algorithm: str = "blake2b") -> str:
     """
     Compute cryptographic hash of a file.
 
+    The default BLAKE2b is considerably faster than SHA-256 in software;
+    the digest is only used for local change detection, integrity at rest
+    is provided by AES-GCM.
+
+    The file is read into a reused buffer rather than memory-mapped: the
+    workspace files hashed here may be truncated by Obsidian mid-hash,
+    which would fault a mapping, and on Windows an open mapping blocks
+    Obsidian from truncating the file.
+
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm (sha256, sha512, etc.)
+        algorithm: Hash algorithm (blake2b, sha256, etc.)
 
     Returns:
         str: Hexadecimal hash digest
@@ -21,15 +45,29 @@ def compute_file_hash(file_path: str | Path, algorithm: str = "sha256") -> str:
         FileNotFoundError: If file doesn't exist
     """
     file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
     hasher = hashlib.new(algorithm)
 
-    with open(file_path, 'rb') as f:
-        # Read in chunks to handle large files
-        while chunk := f.read(8192):
-            hasher.update(chunk)
+    # open() raises FileNotFoundError for a missing file
+    with open(file_path, 'rb', buffering=0) as f:
+        view = _read_buffer()
+        while n := f.readinto(view):
+            hasher.update(view[:n])
 
     return hasher.hexdigest()
+
+
+def compute_data_hash(data: bytes, algorithm: str = "blake2b") -> str:
+    """
+    Compute cryptographic hash of in-memory data.
+
+    Produces the same digest compute_file_hash would for a file holding
+    data, so content can be tracked without reading it back from disk.
+
+    Args:
+        data: Bytes-like data to hash
+        algorithm: Hash algorithm (blake2b, sha256, etc.)
+
+    Returns:
+        str: Hexadecimal hash digest
+    """
+    return hashlib.new(algorithm, data).hexdigest()
@@ -2,16 +2,37 @@
 Logging configuration for ObsidianSecure.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 from pathlib import Path
 from ..config import LOG_LEVEL, LOG_FORMAT
 
+# Background listener that writes queued records; replaced on each setup
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(log_file: str | Path | None = None, level: str = LOG_LEVEL) -> logging.Logger:
     """
     Configure logging for the application.
 
+    Records are put on a queue and written by a background QueueListener,
+    so logging never blocks the calling thread on console or file IO.
+
     Args:
         log_file: Optional path to log file (if None, logs to console only)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -22,29 +43,42 @@ def setup_logging(log_file: str | Path | None = None, level: str = LOG_LEVEL) ->
     Note:
         Logs will NOT contain sensitive data (passwords, plaintext content).
     """
+    global _listener
+
     logger = logging.getLogger("ObsidianSecure")
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers and flush any previous listener
     logger.handlers.clear()
+    _stop_listener()
+
+    handlers: list[logging.Handler] = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter(LOG_FORMAT)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
-    # File handler (if specified)
+    # File handler (if specified), opened on the first record
     if log_file:
         log_file = Path(log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(getattr(logging, level.upper()))
         file_formatter = logging.Formatter(LOG_FORMAT)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
 
     return logger
 
@@ -61,14 +95,14 @@ class SensitiveDataFilter(logging.Filter):
         "plaintext",
     ]
 
+    # All keywords in one case-insensitive alternation, matched in C
+    _PATTERN = re.compile("|".join(map(re.escape, REDACTED_KEYWORDS)), re.IGNORECASE)
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Redact sensitive data from log records."""
-        message = record.getMessage().lower()
-
-        for keyword in self.REDACTED_KEYWORDS:
-            if keyword in message:
-                # Don't completely block, but warn
-                record.msg = "[REDACTED - Sensitive data filtered]"
-                break
+        if self._PATTERN.search(record.getMessage()):
+            # Don't completely block, but warn
+            record.msg = "[REDACTED - Sensitive data filtered]"
+            record.args = None
 
         return True
@@ -2,10 +2,14 @@
 Vault discovery and validation.
 """
 
+import os
 from pathlib import Path
 from .layout import VaultLayout
 from ..config import INDEX_FILENAME
 
+# Directory names never searched for vaults (in addition to hidden ones)
+_SKIP_DIRS = frozenset({"node_modules", "venv", "__pycache__"})
+
 
 def is_valid_vault(vault_path: str | Path) -> bool:
     """
@@ -37,6 +41,10 @@ def discover_vaults(search_path: str | Path) -> list[Path]:
     """
     Discover all valid vaults in a directory tree.
 
+    Hidden directories (``.git``, ``.obsidian``, ``.cache``, ...) and
+    dependency folders such as ``node_modules`` are not searched, and
+    the walk does not descend into vaults it finds.
+
     Args:
         search_path: Root path to search
 
@@ -49,10 +57,30 @@ def discover_vaults(search_path: str | Path) -> list[Path]:
     if not search_path.exists():
         return vaults
 
-    # Search recursively
-    for path in search_path.rglob(".vault_id"):
-        vault_path = path.parent
-        if is_valid_vault(vault_path):
-            vaults.append(vault_path)
+    stack = [str(search_path)]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        has_vault_id = has_index = False
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith(".") and name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif name == ".vault_id":
+                        has_vault_id = True
+                    elif name == INDEX_FILENAME:
+                        has_index = True
+        except OSError:
+            continue  # Unreadable directory
+
+        # Same checks as is_valid_vault, from the listing already read
+        if has_vault_id and has_index:
+            vaults.append(Path(directory))
+        else:
+            stack.extend(subdirs)
 
     return vaults
@@ -2,18 +2,20 @@
 Encrypted index for mapping file IDs to real names and structure.
 """
 
-import json
-import uuid
+import io
+import os
 from dataclasses import dataclass, field
-from typing import Literal, Dict, Optional
+from typing import BinaryIO, Literal, Dict, Optional, Tuple
 from pathlib import Path
 
-from ..crypto import encrypt_data, decrypt_data
-from ..io import atomic_write
+import orjson
+
+from ..crypto import encrypt_data, encrypt_stream, decrypt_data, create_encrypted_file, read_encrypted_file
+from ..io import atomic_open
 from ..config import INDEX_FILENAME
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexNode:
     """Represents a file or folder in the vault index."""
 
@@ -57,6 +59,15 @@ class VaultIndex:
         self.vault_id = vault_id
         self.nodes: Dict[str, IndexNode] = {}
 
+        # Adjacency indexes, maintained by add_node/remove_node:
+        # parent ID -> {child ID: child}, and (parent ID, name) -> child ID
+        self._children: Dict[Optional[str], Dict[str, IndexNode]] = {}
+        self._child_by_name: Dict[Tuple[Optional[str], str], str] = {}
+
+        # Memoized get_path results. Nodes are never renamed or moved and only
+        # leaves can be removed, so entries only need dropping on removal.
+        self._path_cache: Dict[str, str] = {}
+
     def add_node(
         self,
         name: str,
@@ -80,13 +91,14 @@ class VaultIndex:
             ValueError: If parent doesn't exist or is not a folder
         """
         if node_id is None:
-            node_id = uuid.uuid4().hex[:8]  # Short ID for filenames
+            node_id = self._new_node_id()
 
         # Validate parent exists and is a folder
         if parent_id is not None:
-            if parent_id not in self.nodes:
+            parent = self.nodes.get(parent_id)
+            if parent is None:
                 raise ValueError(f"Parent node {parent_id} does not exist")
-            if self.nodes[parent_id].node_type != "folder":
+            if parent.node_type != "folder":
                 raise ValueError(f"Parent node {parent_id} is not a folder")
 
         # Check for duplicate ID
@@ -101,8 +113,38 @@ class VaultIndex:
         )
 
         self.nodes[node_id] = node
+        self._link(node)
         return node_id
 
+    def _new_node_id(self) -> str:
+        """Generate an unused short random node ID (8 hex chars, used as filename)."""
+        node_id = os.urandom(4).hex()
+        while node_id in self.nodes:
+            node_id = os.urandom(4).hex()
+        return node_id
+
+    def _link(self, node: IndexNode) -> None:
+        """Add a node to the adjacency indexes."""
+        self._children.setdefault(node.parent_id, {})[node.node_id] = node
+        # The first child added with a name wins, as in a sibling scan
+        self._child_by_name.setdefault((node.parent_id, node.name), node.node_id)
+
+    def _unlink(self, node: IndexNode) -> None:
+        """Remove a node from the adjacency indexes."""
+        siblings = self._children.get(node.parent_id, {})
+        siblings.pop(node.node_id, None)
+        if not siblings:
+            self._children.pop(node.parent_id, None)
+
+        key = (node.parent_id, node.name)
+        if self._child_by_name.get(key) == node.node_id:
+            del self._child_by_name[key]
+            # Fall back to another sibling with the same name, if any
+            for sibling in siblings.values():
+                if sibling.name == node.name:
+                    self._child_by_name[key] = sibling.node_id
+                    break
+
     def remove_node(self, node_id: str) -> None:
         """
         Remove a node from the index.
@@ -113,26 +155,36 @@ class VaultIndex:
         Raises:
             ValueError: If node doesn't exist or has children
         """
-        if node_id not in self.nodes:
+        node = self.nodes.get(node_id)
+        if node is None:
             raise ValueError(f"Node {node_id} does not exist")
 
         # Check for children
-        children = self.get_children(node_id)
-        if children:
+        if self._children.get(node_id):
             raise ValueError(f"Cannot remove node {node_id} with children")
 
         del self.nodes[node_id]
+        self._unlink(node)
+        self._path_cache.pop(node_id, None)
 
     def get_node(self, node_id: str) -> Optional[IndexNode]:
         """Get a node by ID."""
         return self.nodes.get(node_id)
 
+    def get_root_id(self) -> Optional[str]:
+        """
+        Get the root folder's node ID.
+
+        Returns:
+            Optional[str]: ID of the first node added without a parent, or
+            None if the index is empty
+        """
+        roots = self._children.get(None)
+        return next(iter(roots)) if roots else None
+
     def get_children(self, parent_id: str) -> list[IndexNode]:
         """Get all children of a parent node."""
-        return [
-            node for node in self.nodes.values()
-            if node.parent_id == parent_id
-        ]
+        return list(self._children.get(parent_id, {}).values())
 
     def get_path(self, node_id: str) -> str:
         """
@@ -147,20 +199,55 @@ class VaultIndex:
         Raises:
             ValueError: If node doesn't exist
         """
+        cached = self._path_cache.get(node_id)
+        if cached is not None:
+            return cached
+
         if node_id not in self.nodes:
             raise ValueError(f"Node {node_id} does not exist")
 
-        parts = []
+        # Walk up to the nearest ancestor with a cached path
+        pending = []
         current_id = node_id
+        base = ""
 
         while current_id is not None:
+            if current_id in self._path_cache:
+                base = self._path_cache[current_id]
+                break
+
             node = self.nodes[current_id]
-            # Only include nodes that have a parent (exclude root folder)
-            if node.parent_id is not None:
-                parts.insert(0, node.name)
+            if node.parent_id is None:
+                # Root folder is excluded from paths
+                self._path_cache[current_id] = ""
+                break
+
+            pending.append((current_id, node.name))
             current_id = node.parent_id
 
-        return "/".join(parts) if parts else ""
+        # Build paths back down, caching every ancestor on the way
+        path = base
+        for current_id, name in reversed(pending):
+            path = f"{path}/{name}" if path else name
+            self._path_cache[current_id] = path
+
+        return path
+
+    def build_path_index(self) -> Dict[str, str]:
+        """
+        Map the path of every file node to its node ID.
+
+        Useful for resolving many paths at once instead of calling
+        find_by_path, which scans the index, for each one.
+
+        Returns:
+            Dict[str, str]: File path (as returned by get_path) to node ID
+        """
+        return {
+            self.get_path(node_id): node_id
+            for node_id, node in self.nodes.items()
+            if node.node_type == "file"
+        }
 
     def find_by_path(self, path: str) -> Optional[str]:
         """
@@ -173,38 +260,24 @@ class VaultIndex:
         Returns:
             Optional[str]: Node ID if found, None otherwise
         """
+        root_id = self.get_root_id()
+
         if not path:
             # Empty path refers to root folder
-            for node in self.nodes.values():
-                if node.parent_id is None:
-                    return node.node_id
-            return None
-
-        parts = path.split("/") if path else []
-
-        # Find the root folder first
-        root_id = None
-        for node in self.nodes.values():
-            if node.parent_id is None:
-                root_id = node.node_id
-                break
+            return root_id
 
         if root_id is None:
             return None
 
+        parts = path.split("/")
+
         # Start searching from root folder's children
         current_id = root_id
 
         for part in parts:
             # Find child with matching name
-            found = False
-            for node in self.nodes.values():
-                if node.parent_id == current_id and node.name == part:
-                    current_id = node.node_id
-                    found = True
-                    break
-
-            if not found:
+            current_id = self._child_by_name.get((current_id, part))
+            if current_id is None:
                 return None
 
         return current_id
@@ -219,13 +292,32 @@ class VaultIndex:
             },
         }
 
+    def _serialize(self) -> bytes:
+        """
+        Serialize the index to JSON bytes.
+
+        Nodes are encoded by orjson through IndexNode.to_dict without
+        building the intermediate nodes dict. The result is not kept, so
+        the plaintext index does not stay in memory between saves.
+
+        Returns:
+            bytes: UTF-8 JSON equivalent to ``to_dict()``
+        """
+        return orjson.dumps(
+            {"vault_id": self.vault_id, "nodes": self.nodes},
+            default=IndexNode.to_dict,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> "VaultIndex":
         """Deserialize index from dictionary."""
         index = cls(vault_id=data["vault_id"])
 
         for node_id, node_data in data.get("nodes", {}).items():
-            index.nodes[node_id] = IndexNode.from_dict(node_id, node_data)
+            node = IndexNode.from_dict(node_id, node_data)
+            index.nodes[node_id] = node
+            index._link(node)
 
         return index
 
@@ -240,10 +332,24 @@ class VaultIndex:
         Returns:
             bytes: Encrypted index data
         """
-        plaintext = json.dumps(self.to_dict(), indent=2).encode('utf-8')
+        plaintext = self._serialize()
         ciphertext, _ = encrypt_data(plaintext, key, nonce)
         return ciphertext
 
+    def encrypt_to_writer(self, writer: BinaryIO, key: bytes, nonce: bytes) -> None:
+        """
+        Encrypt the index into a writable stream.
+
+        Produces the same bytes as :meth:`encrypt`, but writes them chunk by
+        chunk so the full ciphertext is never held in memory.
+
+        Args:
+            writer: Writable binary stream
+            key: Encryption key
+            nonce: Nonce for encryption
+        """
+        encrypt_stream(io.BytesIO(self._serialize()), writer, key, nonce)
+
     @classmethod
     def decrypt(cls, ciphertext: bytes, key: bytes, nonce: bytes) -> "VaultIndex":
         """
@@ -261,7 +367,7 @@ class VaultIndex:
             ValueError: If decryption fails or data is invalid
         """
         plaintext = decrypt_data(ciphertext, key, nonce)
-        data = json.loads(plaintext.decode('utf-8'))
+        data = orjson.loads(plaintext)
         return cls.from_dict(data)
 
     def save(self, vault_path: Path, key: bytes, salt: bytes, nonce: bytes) -> None:
@@ -274,25 +380,20 @@ class VaultIndex:
             salt: Salt used for key derivation
             nonce: Nonce for encryption
         """
-        from ..crypto.formats import create_encrypted_file
-
-        # Encrypt index
-        plaintext = json.dumps(self.to_dict(), indent=2).encode('utf-8')
-        ciphertext, actual_nonce = encrypt_data(plaintext, key, nonce)
-
-        # Create encrypted file
-        enc_file = create_encrypted_file(
-            plaintext=plaintext,
+        # Header only; the ciphertext is streamed in after it
+        header = create_encrypted_file(
             file_id=self.vault_id,
             file_type="index",
-            ciphertext=ciphertext,
+            ciphertext=b'',
             salt=salt,
-            nonce=actual_nonce,
-        )
+            nonce=nonce,
+        ).to_bytes()
 
         # Save to disk
         index_path = vault_path / INDEX_FILENAME
-        atomic_write(index_path, enc_file.to_bytes())
+        with atomic_open(index_path) as f:
+            f.write(header)
+            self.encrypt_to_writer(f, key, nonce)
 
     @classmethod
     def load(cls, vault_path: Path, key: bytes) -> "VaultIndex":
@@ -310,8 +411,6 @@ class VaultIndex:
             FileNotFoundError: If index doesn't exist
             ValueError: If decryption fails
         """
-        from ..crypto.formats import read_encrypted_file
-
         index_path = vault_path / INDEX_FILENAME
 
         if not index_path.exists():
@@ -2,8 +2,10 @@
 Vault directory layout management.
 """
 
+import os
 import uuid
 from pathlib import Path
+from typing import Optional
 from ..config import ENCRYPTED_FILE_EXT, INDEX_FILENAME
 
 
@@ -18,6 +20,7 @@ class VaultLayout:
             vault_path: Path to vault root directory
         """
         self.vault_path = Path(vault_path)
+        self._vault_id: Optional[str] = None
 
     def initialize(self) -> str:
         """
@@ -45,6 +48,7 @@ class VaultLayout:
 
         metadata_path = self.vault_path / ".vault_id"
         metadata_path.write_text(vault_id, encoding='utf-8')
+        self._vault_id = vault_id
 
         return vault_id
 
@@ -52,18 +56,25 @@ class VaultLayout:
         """
         Get the vault ID from metadata.
 
+        The ID is read from disk once and cached on the layout.
+
         Returns:
             str: Vault ID
 
         Raises:
             FileNotFoundError: If vault metadata doesn't exist
         """
+        if self._vault_id is not None:
+            return self._vault_id
+
         metadata_path = self.vault_path / ".vault_id"
 
-        if not metadata_path.exists():
-            raise FileNotFoundError(f"Vault metadata not found: {metadata_path}")
+        try:
+            self._vault_id = metadata_path.read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Vault metadata not found: {metadata_path}") from None
 
-        return metadata_path.read_text(encoding='utf-8').strip()
+        return self._vault_id
 
     def get_encrypted_file_path(self, file_id: str) -> Path:
         """
@@ -88,11 +99,16 @@ class VaultLayout:
         Returns:
             list[Path]: List of encrypted file paths
         """
-        if not self.vault_path.exists():
+        try:
+            with os.scandir(self.vault_path) as it:
+                return [
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.endswith(ENCRYPTED_FILE_EXT) and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
             return []
 
-        return list(self.vault_path.glob(f"*{ENCRYPTED_FILE_EXT}"))
-
     def exists(self) -> bool:
         """Check if vault exists."""
-        return self.vault_path.exists() and (self.vault_path / ".vault_id").exists()
+        return os.path.isfile(os.path.join(self.vault_path, ".vault_id"))
@@ -3,12 +3,23 @@ High-level vault management operations.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from .layout import VaultLayout
 from .index import VaultIndex
-from ..crypto import derive_master_key, derive_vault_key
+from ..crypto import (
+    derive_master_key_into,
+    derive_vault_key,
+    derive_file_key,
+    encrypt_data,
+    encrypt_stream,
+    create_encrypted_file,
+    secure_zero,
+)
+from ..io import atomic_write, atomic_open
+from ..config import SESSION_WORKERS, STREAM_ENCRYPT_THRESHOLD, NONCE_SIZE, SALT_SIZE, AES_KEY_SIZE
 
 
 class VaultManager:
@@ -40,9 +51,14 @@ class VaultManager:
         layout = VaultLayout(vault_path)
         vault_id = layout.initialize()
 
-        # Derive encryption keys
-        master_key, salt = derive_master_key(password)
-        vault_key = derive_vault_key(master_key, vault_id)
+        # Derive encryption keys; the master key is only needed for the vault key
+        salt = os.urandom(SALT_SIZE)
+        master_key = bytearray(AES_KEY_SIZE)
+        try:
+            derive_master_key_into(password, salt, master_key)
+            vault_key = derive_vault_key(master_key, vault_id)
+        finally:
+            secure_zero(master_key)
 
         # Create empty index
         index = VaultIndex(vault_id)
@@ -51,29 +67,7 @@ class VaultManager:
         index.add_node(name=vault_name, node_type="folder", parent_id=None, node_id="root")
 
         # Save encrypted index
-        nonce = os.urandom(12)
-
-        # Create encrypted index file
-        from ..crypto.formats import create_encrypted_file
-        import json
-
-        plaintext = json.dumps(index.to_dict(), indent=2).encode('utf-8')
-        from ..crypto import encrypt_data
-        ciphertext, actual_nonce = encrypt_data(plaintext, vault_key, nonce)
-
-        enc_file = create_encrypted_file(
-            plaintext=plaintext,
-            file_id=vault_id,
-            file_type="index",
-            ciphertext=ciphertext,
-            salt=salt,
-            nonce=actual_nonce,
-        )
-
-        # Save to disk
-        from ..io import atomic_write
-        index_path = layout.get_index_path()
-        atomic_write(index_path, enc_file.to_bytes())
+        index.save(vault_path, vault_key, salt, os.urandom(12))
 
         return vault_id
 
@@ -113,17 +107,114 @@ class VaultManager:
             parent_id=parent_id,
         )
 
-        # Read and encrypt file
-        plaintext = file_path.read_bytes()
+        try:
+            VaultManager._encrypt_file_to_vault(
+                VaultLayout(vault_path), vault_key, node_id, file_path, salt
+            )
+        except BaseException:
+            index.remove_node(node_id)
+            raise
+
+        return node_id
+
+    @staticmethod
+    def add_files_to_vault(
+        vault_path: Path,
+        vault_key: bytes,
+        index: VaultIndex,
+        file_paths: list[Path],
+        parent_id: str = "root",
+        salt: bytes = b'',
+    ) -> list[str]:
+        """
+        Add many files to the vault, encrypting and writing them in parallel.
+
+        Index nodes are added serially; the per-file read, encryption and
+        atomic write then run on a thread pool. If any file fails, the
+        added nodes and any encrypted files already written are removed
+        again before the error is raised.
+
+        Args:
+            vault_path: Path to vault
+            vault_key: Vault encryption key
+            index: Vault index
+            file_paths: Paths to files to add
+            parent_id: Parent folder node ID
+            salt: Salt for encryption
+
+        Returns:
+            list[str]: Node IDs of added files, in input order
+
+        Raises:
+            FileNotFoundError: If any file doesn't exist (nothing is added)
+            OSError: If a file cannot be read, encrypted or written
+        """
+        for file_path in file_paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        node_ids = [
+            index.add_node(name=file_path.name, node_type="file", parent_id=parent_id)
+            for file_path in file_paths
+        ]
+
+        layout = VaultLayout(vault_path)
+        try:
+            with ThreadPoolExecutor(max_workers=SESSION_WORKERS) as executor:
+                # Consume the results so worker exceptions propagate
+                for _ in executor.map(
+                    lambda item: VaultManager._encrypt_file_to_vault(layout, vault_key, item[0], item[1], salt),
+                    zip(node_ids, file_paths),
+                ):
+                    pass
+        except BaseException:
+            # Every worker has finished once the executor has shut down
+            for node_id in node_ids:
+                layout.get_encrypted_file_path(node_id).unlink(missing_ok=True)
+                index.remove_node(node_id)
+            raise
+
+        return node_ids
+
+    @staticmethod
+    def _encrypt_file_to_vault(
+        layout: VaultLayout,
+        vault_key: bytes,
+        node_id: str,
+        file_path: Path,
+        salt: bytes,
+    ) -> None:
+        """
+        Read, encrypt and atomically write one file as node_id.
 
-        from ..crypto import encrypt_data, derive_file_key
+        Files of at least STREAM_ENCRYPT_THRESHOLD bytes are encrypted as a
+        stream straight into the vault file, so neither the plaintext nor
+        the ciphertext is held in memory in full.
+        """
         file_key = derive_file_key(vault_key, node_id)
+        enc_file_path = layout.get_encrypted_file_path(node_id)
+
+        if file_path.stat().st_size >= STREAM_ENCRYPT_THRESHOLD:
+            nonce = os.urandom(NONCE_SIZE)
+            header = create_encrypted_file(
+                file_id=node_id,
+                file_type="file",
+                ciphertext=b'',
+                salt=salt,
+                nonce=nonce,
+            ).to_bytes()
+
+            with open(file_path, 'rb') as src, atomic_open(enc_file_path) as dst:
+                dst.write(header)
+                encrypt_stream(src, dst, file_key, nonce)
+            return
+
+        # Read and encrypt file
+        plaintext = file_path.read_bytes()
         ciphertext, nonce = encrypt_data(plaintext, file_key)
 
         # Create encrypted file
-        from ..crypto.formats import create_encrypted_file
         enc_file = create_encrypted_file(
-            plaintext=plaintext,
             file_id=node_id,
             file_type="file",
             ciphertext=ciphertext,
@@ -132,14 +223,8 @@ class VaultManager:
         )
 
         # Save to vault
-        layout = VaultLayout(vault_path)
-        enc_file_path = layout.get_encrypted_file_path(node_id)
-
-        from ..io import atomic_write
         atomic_write(enc_file_path, enc_file.to_bytes())
 
-        return node_id
-
     @staticmethod
     def add_folder_to_vault(
         index: VaultIndex,
@@ -22,6 +22,7 @@ setup(
         "argon2-cffi>=23.1.0",
         "PySide6>=6.6.0",
         "watchdog>=4.0.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "dev": [
@@ -35,13 +36,12 @@ setup(
             "obsidian-secure=obsidian_secure.app:main",
         ],
     },
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: End Users/Desktop",
         "Topic :: Security :: Cryptography",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -2,16 +2,27 @@
 Tests for cryptographic primitives.
 """
 
+import io
+import json
+import base64
 import pytest
 from obsidian_secure.crypto import (
     derive_master_key,
+    derive_master_key_into,
     encrypt_data,
     decrypt_data,
+    decrypt_into,
+    encrypt_stream,
+    decrypt_stream,
     derive_vault_key,
     derive_file_key,
+    secure_zero,
     create_encrypted_file,
+    read_encrypted_file,
+    open_and_decrypt,
     EncryptedFile,
 )
+from obsidian_secure.crypto.kdf import verify_password
 
 
 class TestKDF:
@@ -33,6 +44,18 @@ class TestKDF:
 
         assert master_key1 == master_key2
 
+    def test_derive_master_key_into_matches(self):
+        """Test deriving into a buffer gives the same key as derive_master_key."""
+        master_key, salt = derive_master_key("pässword_123")
+        out = bytearray(32)
+
+        derive_master_key_into("pässword_123", salt, out)
+
+        assert out == master_key
+
+        with pytest.raises(ValueError):
+            derive_master_key_into("pässword_123", salt, bytearray(16))
+
     def test_derive_master_key_different_passwords(self):
         """Test that different passwords give different keys."""
         password1 = "password1"
@@ -48,6 +71,14 @@ class TestKDF:
         with pytest.raises(ValueError):
             derive_master_key("")
 
+    def test_verify_password(self):
+        """Test password verification against a derived key."""
+        master_key, salt = derive_master_key("correct_password")
+
+        assert verify_password("correct_password", salt, master_key)
+        assert not verify_password("wrong_password", salt, master_key)
+        assert not verify_password("", salt, master_key)
+
 
 class TestEncryption:
     """Tests for encryption/decryption."""
@@ -74,6 +105,15 @@ class TestEncryption:
 
         assert ciphertext1 != ciphertext2
 
+    def test_generated_nonces_are_unique(self):
+        """Test that generated nonces do not repeat across buffer refills."""
+        key = b"x" * 32
+
+        nonces = {encrypt_data(b"data", key)[1] for _ in range(1000)}
+
+        assert len(nonces) == 1000
+        assert all(len(nonce) == 12 for nonce in nonces)
+
     def test_wrong_key_fails(self):
         """Test that wrong key fails decryption."""
         plaintext = b"secret message"
@@ -100,6 +140,56 @@ class TestEncryption:
         with pytest.raises(Exception):  # InvalidTag
             decrypt_data(tampered, key, nonce)
 
+    def test_decrypt_into_buffer(self):
+        """Test decrypting into a reusable buffer and wiping it."""
+        plaintext = b"buffered plaintext"
+        key = b"x" * 32
+
+        ciphertext, nonce = encrypt_data(plaintext, key)
+        out = bytearray(64)
+        written = decrypt_into(ciphertext, key, nonce, out)
+
+        assert bytes(out[:written]) == plaintext
+
+        secure_zero(out)
+        assert out == bytearray(64)
+
+    def test_stream_matches_one_shot(self):
+        """Test that streaming encryption produces the one-shot layout."""
+        plaintext = bytes(range(256)) * 500  # spans several chunks
+        key = b"x" * 32
+
+        dst = io.BytesIO()
+        nonce = encrypt_stream(io.BytesIO(plaintext), dst, key, chunk_size=4096)
+        ciphertext, _ = encrypt_data(plaintext, key, nonce)
+
+        assert dst.getvalue() == ciphertext
+
+    def test_stream_round_trip(self):
+        """Test streaming decryption of streamed ciphertext."""
+        plaintext = b"streamed note" * 10000
+        key = b"x" * 32
+
+        encrypted = io.BytesIO()
+        nonce = encrypt_stream(io.BytesIO(plaintext), encrypted, key, chunk_size=4096)
+        encrypted.seek(0)
+
+        decrypted = io.BytesIO()
+        decrypt_stream(encrypted, decrypted, key, nonce, chunk_size=4096)
+
+        assert decrypted.getvalue() == plaintext
+
+    def test_stream_tampered_fails(self):
+        """Test that streaming decryption detects tampering."""
+        key = b"x" * 32
+
+        ciphertext, nonce = encrypt_data(b"secret message", key)
+        tampered = bytearray(ciphertext)
+        tampered[0] ^= 0xFF
+
+        with pytest.raises(Exception):  # InvalidTag
+            decrypt_stream(io.BytesIO(bytes(tampered)), io.BytesIO(), key, nonce)
+
 
 class TestHKDF:
     """Tests for HKDF key derivation."""
@@ -131,6 +221,13 @@ class TestHKDF:
 
         assert key1 != key2
 
+    def test_bytes_ids_match_str_ids(self):
+        """Test that pre-encoded ids derive the same keys as str ids."""
+        key = b"x" * 32
+
+        assert derive_vault_key(key, b"vault1") == derive_vault_key(key, "vault1")
+        assert derive_file_key(key, b"file_abc") == derive_file_key(key, "file_abc")
+
 
 class TestEncryptedFileFormat:
     """Tests for encrypted file format."""
@@ -217,3 +314,141 @@ class TestEncryptedFileFormat:
         decrypted = decrypt_data(loaded.ciphertext, key, loaded.nonce)
 
         assert decrypted == plaintext
+
+    def test_legacy_json_header_is_read(self):
+        """Test that version 1 files with a JSON header still parse."""
+        ciphertext, nonce = encrypt_data(b"legacy content", b"x" * 32)
+        header = json.dumps({
+            "magic": "OBSEC1",
+            "version": 1,
+            "kdf": "argon2id",
+            "kdf_params": {"memory_cost": 65536, "time_cost": 3, "parallelism": 4},
+            "cipher": "AES-256-GCM",
+            "salt": base64.b64encode(b"s" * 16).decode("utf-8"),
+            "nonce": base64.b64encode(nonce).decode("utf-8"),
+            "file_id": "legacy",
+            "type": "file",
+        }, indent=2).encode("utf-8")
+        data = len(header).to_bytes(4, byteorder="big") + header + ciphertext
+
+        loaded = EncryptedFile.from_bytes(data)
+
+        assert loaded.version == 1
+        assert loaded.file_id == "legacy"
+        assert loaded.salt == b"s" * 16
+        assert loaded.ciphertext == ciphertext
+
+    def test_truncated_header_fails(self):
+        """Test that a truncated binary header is rejected."""
+        ciphertext, nonce = encrypt_data(b"content", b"x" * 32)
+        enc_file = create_encrypted_file(
+            plaintext=b"content",
+            file_id="test_file",
+            file_type="file",
+            ciphertext=ciphertext,
+            salt=b"0" * 16,
+            nonce=nonce,
+        )
+
+        with pytest.raises(ValueError):
+            EncryptedFile.from_bytes(enc_file.to_bytes()[:20])
+
+    def test_unknown_version_fails(self):
+        """Test that binary headers from other format versions are rejected."""
+        ciphertext, nonce = encrypt_data(b"content", b"x" * 32)
+        enc_file = create_encrypted_file(
+            file_id="test_file",
+            file_type="file",
+            ciphertext=ciphertext,
+            salt=b"0" * 16,
+            nonce=nonce,
+        )
+        data = bytearray(enc_file.to_bytes())
+        data[6] = 3
+
+        with pytest.raises(ValueError):
+            EncryptedFile.from_bytes(bytes(data))
+
+        enc_file.version = 3
+        with pytest.raises(ValueError):
+            enc_file.to_bytes()
+
+    def test_kdf_params_are_read_only(self):
+        """Test that the shared KDF parameters cannot be changed through a header."""
+        ciphertext, nonce = encrypt_data(b"content", b"x" * 32)
+        enc_file = create_encrypted_file(
+            file_id="test_file",
+            file_type="file",
+            ciphertext=ciphertext,
+            salt=b"0" * 16,
+            nonce=nonce,
+        )
+        loaded = EncryptedFile.from_bytes(enc_file.to_bytes())
+
+        with pytest.raises(TypeError):
+            loaded.kdf_params["time_cost"] = 1
+
+        assert enc_file.kdf_params["time_cost"] != 1
+
+    def test_empty_salt_reads_back_as_zeros(self):
+        """Test that an empty salt is stored as zeros."""
+        ciphertext, nonce = encrypt_data(b"content", b"x" * 32)
+        enc_file = create_encrypted_file(
+            file_id="test_file",
+            file_type="file",
+            ciphertext=ciphertext,
+            salt=b"",
+            nonce=nonce,
+        )
+
+        assert EncryptedFile.from_bytes(enc_file.to_bytes()).salt == bytes(16)
+
+    def test_read_encrypted_file_from_disk(self, tmp_path):
+        """Test reading an encrypted file back from disk."""
+        plaintext = b"On-disk content"
+        key = b"x" * 32
+
+        ciphertext, nonce = encrypt_data(plaintext, key)
+        enc_file = create_encrypted_file(
+            plaintext=plaintext,
+            file_id="disk_file",
+            file_type="file",
+            ciphertext=ciphertext,
+            salt=b"s" * 16,
+            nonce=nonce,
+        )
+
+        file_path = tmp_path / "disk_file.enc"
+        file_path.write_bytes(enc_file.to_bytes())
+
+        loaded = read_encrypted_file(file_path)
+
+        assert loaded.file_id == "disk_file"
+        assert decrypt_data(loaded.ciphertext, key, loaded.nonce) == plaintext
+
+    def test_open_and_decrypt(self, tmp_path):
+        """Test the fused read-and-decrypt path, including tampering."""
+        plaintext = b"Fused pipeline content"
+        key = b"x" * 32
+
+        ciphertext, nonce = encrypt_data(plaintext, key)
+        enc_file = create_encrypted_file(
+            plaintext=plaintext,
+            file_id="fused_file",
+            file_type="file",
+            ciphertext=ciphertext,
+            salt=b"s" * 16,
+            nonce=nonce,
+        )
+
+        file_path = tmp_path / "fused_file.enc"
+        data = bytearray(enc_file.to_bytes())
+        file_path.write_bytes(data)
+
+        assert open_and_decrypt(file_path, key) == plaintext
+
+        data[-1] ^= 0xFF
+        file_path.write_bytes(data)
+
+        with pytest.raises(Exception):  # InvalidTag
+            open_and_decrypt(file_path, key)
@@ -0,0 +1,228 @@
+"""
+Tests for secure file I/O.
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+from obsidian_secure.io import (
+    atomic_write,
+    atomic_write_stream,
+    atomic_open,
+    secure_delete_file,
+    secure_delete_directory,
+    is_memory_backed,
+)
+
+
+class TestAtomicWrite:
+    """Tests for atomic writes."""
+
+    def test_atomic_write_creates_file(self, tmp_path):
+        """Test writing a new file."""
+        file_path = tmp_path / "nested" / "file.enc"
+
+        atomic_write(file_path, b"encrypted data")
+
+        assert file_path.read_bytes() == b"encrypted data"
+
+    def test_atomic_write_replaces_file(self, tmp_path):
+        """Test overwriting an existing file leaves no temp files."""
+        file_path = tmp_path / "file.enc"
+        file_path.write_bytes(b"old")
+
+        atomic_write(file_path, b"new")
+
+        assert file_path.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_atomic_write_recreates_removed_parent(self, tmp_path):
+        """Test writing again after a cached parent directory was deleted."""
+        file_path = tmp_path / "nested" / "file.enc"
+        atomic_write(file_path, b"first")
+
+        file_path.unlink()
+        file_path.parent.rmdir()
+        atomic_write(file_path, b"second")
+
+        assert file_path.read_bytes() == b"second"
+
+    def test_atomic_write_stream(self, tmp_path):
+        """Test writing a file from chunks."""
+        file_path = tmp_path / "file.enc"
+
+        atomic_write_stream(file_path, (bytes([i]) * 1000 for i in range(5)))
+
+        assert file_path.read_bytes() == b"".join(bytes([i]) * 1000 for i in range(5))
+
+    def test_atomic_write_stream_failure_keeps_target(self, tmp_path):
+        """Test that a failing producer leaves the old file and no temp file."""
+        file_path = tmp_path / "file.enc"
+        file_path.write_bytes(b"old")
+
+        def chunks():
+            yield b"partial"
+            raise RuntimeError("producer failed")
+
+        with pytest.raises(RuntimeError):
+            atomic_write_stream(file_path, chunks())
+
+        assert file_path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_atomic_open(self, tmp_path):
+        """Test writing a file through a stream."""
+        file_path = tmp_path / "file.enc"
+        file_path.write_bytes(b"old")
+
+        with atomic_open(file_path) as f:
+            f.write(b"new ")
+            f.write(b"content")
+            assert file_path.read_bytes() == b"old"
+
+        assert file_path.read_bytes() == b"new content"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_atomic_open_failure_keeps_target(self, tmp_path):
+        """Test that an error inside the block leaves the old file."""
+        file_path = tmp_path / "file.enc"
+        file_path.write_bytes(b"old")
+
+        with pytest.raises(RuntimeError):
+            with atomic_open(file_path) as f:
+                f.write(b"partial")
+                raise RuntimeError("writer failed")
+
+        assert file_path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+
+class TestSecureDelete:
+    """Tests for secure deletion."""
+
+    def test_secure_delete_file(self, tmp_path):
+        """Test deleting a single file."""
+        file_path = tmp_path / "secret.md"
+        file_path.write_bytes(b"secret" * 1000)
+
+        secure_delete_file(file_path)
+
+        assert not file_path.exists()
+
+    def test_secure_delete_directory(self, tmp_path):
+        """Test deleting a nested directory tree."""
+        workspace = tmp_path / "workspace"
+        for i in range(10):
+            folder = workspace / f"folder_{i}" / "sub"
+            folder.mkdir(parents=True)
+            (folder / "note.md").write_text(f"note {i}")
+            (workspace / f"root_{i}.md").write_text(f"root {i}")
+        (workspace / "empty").mkdir()
+
+        secure_delete_directory(workspace)
+
+        assert not workspace.exists()
+
+    def test_secure_delete_directory_keeps_symlink_target(self, tmp_path):
+        """Test that symlinks are removed without overwriting their target."""
+        target = tmp_path / "outside.md"
+        target.write_bytes(b"keep me")
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        try:
+            (workspace / "link.md").symlink_to(target)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+
+        secure_delete_directory(workspace)
+
+        assert not workspace.exists()
+        assert target.read_bytes() == b"keep me"
+
+    def test_secure_delete_directory_rejects_file(self, tmp_path):
+        """Test that passing a file raises an error."""
+        file_path = tmp_path / "file.md"
+        file_path.write_text("content")
+
+        with pytest.raises(ValueError):
+            secure_delete_directory(file_path)
+
+    def test_secure_delete_directory_overwrites_late_files(self, tmp_path, monkeypatch):
+        """Test files created during deletion are overwritten, not just unlinked."""
+        from obsidian_secure.io import secure_delete as secure_delete_module
+
+        dir_path = tmp_path / "workspace"
+        (dir_path / "sub").mkdir(parents=True)
+        (dir_path / "sub" / "note.md").write_text("note")
+
+        original = secure_delete_module.secure_delete_file
+        overwritten = []
+
+        def secure_delete_file(file_path, size=None):
+            if not overwritten:
+                # Another program writes a file after the walk
+                (dir_path / "sub" / "late.md").write_text("late")
+            overwritten.append(os.path.basename(file_path))
+            original(file_path, size)
+
+        monkeypatch.setattr(secure_delete_module, "secure_delete_file", secure_delete_file)
+
+        secure_delete_directory(dir_path)
+
+        assert not dir_path.exists()
+        assert sorted(overwritten) == ["late.md", "note.md"]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/dev/zero sendfile is Linux-only")
+    def test_zero_fd_is_close_on_exec(self):
+        """Test the shared /dev/zero descriptor is not inherited and can be closed."""
+        import fcntl
+        from obsidian_secure.io import secure_delete as secure_delete_module
+
+        fd = secure_delete_module._get_zero_fd()
+        assert fcntl.fcntl(fd, fcntl.F_GETFD) & fcntl.FD_CLOEXEC
+
+        secure_delete_module._close_zero_fd()
+        assert secure_delete_module._zero_fd is None
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
+class TestSecureDeleteSettings:
+    """Tests for parsing secure deletion settings from the environment."""
+
+    def test_env_int(self, monkeypatch):
+        """Test malformed and non-positive values fall back or are clamped."""
+        from obsidian_secure.config import _env_int
+
+        monkeypatch.delenv("OBSIDIANSECURE_TEST_INT", raising=False)
+        assert _env_int("OBSIDIANSECURE_TEST_INT", 3) == 3
+
+        for raw, expected in (("5", 5), ("abc", 3), ("", 3), ("0", 1), ("-2", 1)):
+            monkeypatch.setenv("OBSIDIANSECURE_TEST_INT", raw)
+            assert _env_int("OBSIDIANSECURE_TEST_INT", 3) == expected
+
+    def test_env_flag(self, monkeypatch):
+        """Test boolean flags from the environment."""
+        from obsidian_secure.config import _env_flag
+
+        monkeypatch.delenv("OBSIDIANSECURE_TEST_FLAG", raising=False)
+        assert _env_flag("OBSIDIANSECURE_TEST_FLAG", True)
+
+        for raw, expected in (("0", False), ("off", False), ("False", False), ("1", True), ("yes", True)):
+            monkeypatch.setenv("OBSIDIANSECURE_TEST_FLAG", raw)
+            assert _env_flag("OBSIDIANSECURE_TEST_FLAG", True) is expected
+
+
+class TestMemoryBacked:
+    """Tests for RAM-backed filesystem detection."""
+
+    @pytest.mark.skipif(not Path("/dev/shm").is_dir(), reason="no /dev/shm")
+    def test_dev_shm_is_memory_backed(self):
+        """Test /dev/shm (tmpfs on Linux) is detected."""
+        assert is_memory_backed("/dev/shm")
+
+    def test_proc_is_not_memory_backed(self):
+        """Test a non-tmpfs filesystem is not reported as RAM-backed."""
+        assert not is_memory_backed("/proc")
@@ -0,0 +1,226 @@
+"""
+Tests for session workspaces.
+"""
+
+import os
+import threading
+import pytest
+from pathlib import Path
+
+from obsidian_secure.session import workspace as workspace_module
+from obsidian_secure.session import SessionManager
+from obsidian_secure.session import manager as manager_module
+from obsidian_secure.session.watcher import FileWatcher
+from obsidian_secure.session.workspace import Workspace
+from obsidian_secure.vault import VaultIndex, VaultManager
+
+
+def _make_workspace(tmp_path: Path, count: int) -> tuple[Workspace, list[Path]]:
+    """Create a workspace rooted in tmp_path with count notes."""
+    workspace = Workspace("test")
+    workspace.workspace_path = tmp_path
+
+    paths = []
+    for i in range(count):
+        path = Path(f"note{i}.md")
+        (tmp_path / path).write_text(f"note {i}")
+        paths.append(path)
+
+    return workspace, paths
+
+
+class TestWorkspaceTracking:
+    """Tests for workspace change detection."""
+
+    def test_track_files_matches_track_file(self, tmp_path):
+        """Test parallel tracking records the same hashes as serial tracking."""
+        workspace, paths = _make_workspace(tmp_path, 20)
+
+        workspace.track_files(paths)
+        parallel = dict(workspace.file_hashes)
+
+        workspace.file_hashes.clear()
+        for path in paths:
+            workspace.track_file(path)
+
+        assert parallel == workspace.file_hashes
+        assert len(parallel) == 20
+
+    def test_get_modified_files(self, tmp_path):
+        """Test modified and deleted files are reported."""
+        workspace, paths = _make_workspace(tmp_path, 5)
+        workspace.track_files(paths)
+
+        (tmp_path / paths[1]).write_text("changed")
+        (tmp_path / paths[3]).unlink()
+
+        assert sorted(workspace.get_modified_files()) == [paths[1], paths[3]]
+
+    def test_list_files_skips_obsidian_config(self, tmp_path):
+        """Test listing nested notes while skipping config and other files."""
+        workspace, _ = _make_workspace(tmp_path, 0)
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / ".obsidian").mkdir()
+        for name in ["x.md", "a/y.md", "a/b/z.md", ".obsidian/q.md", "a/n.txt"]:
+            (tmp_path / name).write_text("content")
+
+        assert sorted(workspace.list_files()) == [
+            Path("a/b/z.md"),
+            Path("a/y.md"),
+            Path("x.md"),
+        ]
+
+    def test_node_paths(self, tmp_path):
+        """Test workspace paths for nested nodes, before and after caching."""
+        workspace, _ = _make_workspace(tmp_path, 0)
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("Root", "folder")
+        a_id = index.add_node("a", "folder", parent_id=root_id)
+        b_id = index.add_node("b", "folder", parent_id=a_id)
+        file_id = index.add_node("note.md", "file", parent_id=b_id)
+
+        assert workspace._get_node_path(index, file_id) == tmp_path / "a" / "b" / "note.md"
+
+        workspace.build_tree(index)
+        assert (tmp_path / "a" / "b").is_dir()
+        assert workspace._get_node_path(index, root_id) == tmp_path
+        assert workspace._get_node_path(index, file_id) == tmp_path / "a" / "b" / "note.md"
+
+    def test_write_file_from_buffer(self, tmp_path):
+        """Test writing a bytearray, tracking it, and owner-only permissions."""
+        workspace, _ = _make_workspace(tmp_path, 0)
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("Root", "folder")
+        file_id = index.add_node("note.md", "file", parent_id=root_id)
+
+        workspace.write_file(index, file_id, bytearray(b"secret" * 1000), track=True)
+
+        file_path = tmp_path / "note.md"
+        assert file_path.read_bytes() == b"secret" * 1000
+        assert workspace.get_modified_files() == []
+        if os.name == "posix":
+            assert file_path.stat().st_mode & 0o777 == 0o600
+
+    def test_stat_changed(self, tmp_path):
+        """Test metadata change detection for tracked files."""
+        workspace, paths = _make_workspace(tmp_path, 2)
+        workspace.track_files(paths)
+
+        assert not workspace.stat_changed(paths[0])
+        (tmp_path / paths[0]).write_text("a longer replacement")
+        assert workspace.stat_changed(paths[0])
+        assert workspace.stat_changed(Path("untracked.md"))
+
+
+class TestFileWatcher:
+    """Tests for workspace file watching."""
+
+    def test_events_are_coalesced(self, tmp_path):
+        """Test repeated events for one file are reported once."""
+        changes = []
+        watcher = FileWatcher(tmp_path, on_change=changes.append)
+
+        for _ in range(100):
+            watcher._on_file_changed(str(tmp_path / "note.md"))
+        watcher._on_file_changed(tmp_path / ".obsidian" / "app.json")
+        watcher._on_file_changed(tmp_path.parent / "outside.md")
+
+        assert watcher.get_changed_files() == [Path("note.md")]
+        assert changes == [Path("note.md")]
+
+    def test_clear_races_with_flush_thread(self, tmp_path):
+        """Test clearing while the flush thread runs loses no bookkeeping."""
+        watcher = FileWatcher(tmp_path)
+        watcher._stop_event.clear()
+        flusher = threading.Thread(target=watcher._flush_loop, daemon=True)
+        flusher.start()
+        try:
+            for i in range(2000):
+                watcher._on_file_changed(tmp_path / f"note{i % 50}.md")
+                if i % 100 == 0:
+                    watcher.get_changed_files()
+                    watcher.clear_changes()
+        finally:
+            watcher._stop_event.set()
+            flusher.join(timeout=5)
+
+        watcher.clear_changes()
+        assert watcher.get_changed_files() == []
+
+
+class TestSessionRoundTrip:
+    """Tests for unlocking and locking a vault."""
+
+    def test_lock_then_unlock_preserves_changes(self, tmp_path, monkeypatch):
+        """Test modified and new files survive a lock/unlock cycle."""
+        monkeypatch.setattr(workspace_module, "WORKSPACE_BASE", tmp_path / "ws")
+        vault_path = tmp_path / "vault"
+        VaultManager.create_vault(vault_path, "password123", "Test")
+
+        session = SessionManager(vault_path)
+        workspace_path = session.unlock("password123").workspace_path
+        for i in range(10):
+            (workspace_path / f"note{i}.md").write_text(f"note {i}")
+        (workspace_path / "sub").mkdir()
+        (workspace_path / "sub" / "deep.md").write_text("deep")
+        (workspace_path / "sub" / "deep2.md").write_text("deep 2")
+        session.lock()
+
+        session = SessionManager(vault_path)
+        workspace_path = session.unlock("password123").workspace_path
+        assert len(session.workspace.file_hashes) == 12
+        assert session.workspace.get_modified_files() == []
+        (workspace_path / "note3.md").write_text("edited")
+        (workspace_path / "note4.md").unlink()
+        session.lock()
+
+        session = SessionManager(vault_path)
+        workspace_path = session.unlock("password123").workspace_path
+        try:
+            assert (workspace_path / "note0.md").read_text() == "note 0"
+            assert (workspace_path / "note3.md").read_text() == "edited"
+            assert not (workspace_path / "note4.md").exists()
+            assert (workspace_path / "sub" / "deep.md").read_text() == "deep"
+            assert (workspace_path / "sub" / "deep2.md").read_text() == "deep 2"
+            folders = [n for n in session.index.nodes.values() if n.name == "sub"]
+            assert len(folders) == 1
+        finally:
+            session.lock()
+
+    def test_lock_wipes_master_key(self, tmp_path, monkeypatch):
+        """Test the master key buffer is zeroed when the vault is locked."""
+        monkeypatch.setattr(workspace_module, "WORKSPACE_BASE", tmp_path / "ws")
+        vault_path = tmp_path / "vault"
+        VaultManager.create_vault(vault_path, "password123", "Test")
+
+        session = SessionManager(vault_path)
+        session.unlock("password123")
+        master_key = session.master_key
+        assert any(master_key)
+
+        session.lock()
+
+        assert session.master_key is None
+        assert master_key == bytearray(len(master_key))
+
+    def test_wrong_password_wipes_master_key(self, tmp_path, monkeypatch):
+        """Test a rejected password leaves no derived master key behind."""
+        monkeypatch.setattr(workspace_module, "WORKSPACE_BASE", tmp_path / "ws")
+        vault_path = tmp_path / "vault"
+        VaultManager.create_vault(vault_path, "password123", "Test")
+
+        buffers = []
+        original = manager_module.derive_master_key_into
+
+        def derive(password, salt, out):
+            buffers.append(out)
+            original(password, salt, out)
+
+        monkeypatch.setattr(manager_module, "derive_master_key_into", derive)
+        session = SessionManager(vault_path)
+
+        with pytest.raises(ValueError):
+            session.unlock("wrong password")
+
+        assert session.master_key is None
+        assert buffers[0] == bytearray(len(buffers[0]))
@@ -0,0 +1,77 @@
+"""
+Tests for utility functions.
+"""
+
+import hashlib
+import logging
+import pytest
+
+from obsidian_secure.utils import compute_file_hash, compute_data_hash
+from obsidian_secure.utils.logging import SensitiveDataFilter
+
+
+class TestComputeFileHash:
+    """Tests for file hashing."""
+
+    @pytest.mark.parametrize("size", [0, 100, 3 * 1024 * 1024 + 7])
+    def test_matches_hashlib(self, tmp_path, size):
+        """Test hashes match hashlib for empty, small and multi-chunk files."""
+        data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+        file_path = tmp_path / "note.md"
+        file_path.write_bytes(data)
+
+        assert compute_file_hash(file_path) == hashlib.blake2b(data).hexdigest()
+
+    def test_large_file_is_not_memory_mapped(self, tmp_path, monkeypatch):
+        """Test workspace files are read, never mapped (a truncation would fault)."""
+        import mmap
+
+        def fail(*args, **kwargs):
+            raise AssertionError("compute_file_hash must not mmap")
+
+        monkeypatch.setattr(mmap, "mmap", fail)
+        file_path = tmp_path / "note.md"
+        file_path.write_bytes(b"x" * (2 * 1024 * 1024))
+
+        assert compute_file_hash(file_path) == hashlib.blake2b(b"x" * (2 * 1024 * 1024)).hexdigest()
+
+    def test_other_algorithm(self, tmp_path):
+        """Test a non-default algorithm."""
+        file_path = tmp_path / "note.md"
+        file_path.write_bytes(b"content")
+
+        assert compute_file_hash(file_path, "sha256") == hashlib.sha256(b"content").hexdigest()
+
+    def test_missing_file(self, tmp_path):
+        """Test hashing a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            compute_file_hash(tmp_path / "missing.md")
+
+    def test_data_hash_matches_file_hash(self, tmp_path):
+        """Test hashing bytes in memory matches hashing the same file."""
+        file_path = tmp_path / "note.md"
+        file_path.write_bytes(b"content" * 20000)
+
+        assert compute_data_hash(b"content" * 20000) == compute_file_hash(file_path)
+
+
+class TestSensitiveDataFilter:
+    """Tests for log redaction."""
+
+    @staticmethod
+    def _record(msg, *args):
+        return logging.LogRecord("ObsidianSecure", logging.INFO, __file__, 1, msg, args, None)
+
+    def test_redacts_keywords_case_insensitively(self):
+        """Test messages with sensitive keywords are redacted."""
+        record = self._record("Derived %s for %s", "Vault KEY", "note")
+
+        assert SensitiveDataFilter().filter(record)
+        assert record.getMessage() == "[REDACTED - Sensitive data filtered]"
+
+    def test_keeps_other_messages(self):
+        """Test ordinary messages pass through unchanged."""
+        record = self._record("Locked %d files", 3)
+
+        assert SensitiveDataFilter().filter(record)
+        assert record.getMessage() == "Locked 3 files"
@@ -2,11 +2,38 @@
 Tests for vault management.
 """
 
+import io
+import json
+import os
+import orjson
 import pytest
-import tempfile
 from pathlib import Path
 
-from obsidian_secure.vault import VaultIndex, VaultLayout, VaultManager
+from obsidian_secure.crypto import (
+    derive_master_key,
+    derive_vault_key,
+    derive_file_key,
+    encrypt_data,
+    read_encrypted_file,
+    open_and_decrypt,
+)
+from obsidian_secure.vault import VaultIndex, VaultLayout, VaultManager, discover_vaults, is_valid_vault
+from obsidian_secure.vault import index as index_module
+from obsidian_secure.vault import manager as vault_manager
+
+
+def _create_unlocked_vault(vault_path: Path) -> tuple[Path, bytes, bytes]:
+    """Create a vault and return (vault_path, vault_key, salt)."""
+    vault_id = VaultManager.create_vault(vault_path, "test_password_123", "Test Vault")
+    salt = read_encrypted_file(str(VaultLayout(vault_path).get_index_path())).salt
+    master_key, _ = derive_master_key("test_password_123", salt)
+    return vault_path, derive_vault_key(master_key, vault_id), salt
+
+
+@pytest.fixture(scope="module")
+def unlocked_vault(tmp_path_factory):
+    """Create one vault per module for tests that only read it."""
+    return _create_unlocked_vault(tmp_path_factory.mktemp("shared") / "vault")
 
 
 class TestVaultIndex:
@@ -61,6 +88,80 @@ class TestVaultIndex:
         found_id = index.find_by_path("Secrets/password.md")
         assert found_id == file_id
 
+    def test_build_path_index(self):
+        """Test mapping file paths to node IDs."""
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("VaultRoot", "folder")
+        folder_id = index.add_node("Secrets", "folder", parent_id=root_id)
+        file_id = index.add_node("password.md", "file", parent_id=folder_id)
+        top_id = index.add_node("readme.md", "file", parent_id=root_id)
+
+        assert index.build_path_index() == {
+            "Secrets/password.md": file_id,
+            "readme.md": top_id,
+        }
+
+    def test_adjacency_after_changes(self):
+        """Test children and path lookups stay correct after adds, removes and reload."""
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("VaultRoot", "folder")
+        folder_id = index.add_node("Docs", "folder", parent_id=root_id)
+        first_id = index.add_node("a.md", "file", parent_id=folder_id)
+        second_id = index.add_node("a.md", "file", parent_id=folder_id)
+        other_id = index.add_node("b.md", "file", parent_id=folder_id)
+
+        assert [n.node_id for n in index.get_children(folder_id)] == [first_id, second_id, other_id]
+        assert index.find_by_path("Docs/a.md") == first_id
+
+        index.remove_node(first_id)
+        assert index.find_by_path("Docs/a.md") == second_id
+        assert [n.node_id for n in index.get_children(folder_id)] == [second_id, other_id]
+
+        loaded = VaultIndex.from_dict(index.to_dict())
+        assert loaded.find_by_path("Docs/b.md") == other_id
+        assert loaded.find_by_path("Docs/missing.md") is None
+        assert len(loaded.get_children(folder_id)) == 2
+
+    def test_get_path_cache(self):
+        """Test cached paths for shared ancestors and reused node IDs."""
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("VaultRoot", "folder")
+        a_id = index.add_node("a", "folder", parent_id=root_id)
+        b_id = index.add_node("b", "folder", parent_id=a_id)
+        index.add_node("x.md", "file", parent_id=b_id, node_id="n1")
+
+        assert index.get_path("n1") == "a/b/x.md"
+        index.add_node("y.md", "file", parent_id=b_id, node_id="n2")
+        assert index.get_path("n2") == "a/b/y.md"
+        assert index.get_path(a_id) == "a"
+        assert index.get_path(root_id) == ""
+
+        index.remove_node("n1")
+        index.add_node("z.md", "file", parent_id=a_id, node_id="n1")
+        assert index.get_path("n1") == "a/z.md"
+
+    def test_generated_ids_skip_existing(self, monkeypatch):
+        """Test a generated ID that collides with an existing node is redrawn."""
+        index = VaultIndex("test_vault")
+        index.add_node("VaultRoot", "folder", node_id="00000000")
+
+        draws = iter([b"\x00" * 4, b"\x00\x00\x00\x01"])
+        monkeypatch.setattr(index_module.os, "urandom", lambda n: next(draws))
+
+        assert index.add_node("file.md", "file", parent_id="00000000") == "00000001"
+
+    def test_root_id(self):
+        """Test the root lookup and empty-path resolution."""
+        index = VaultIndex("test_vault")
+        assert index.get_root_id() is None
+        assert index.find_by_path("") is None
+
+        root_id = index.add_node("VaultRoot", "folder")
+        index.add_node("child.md", "file", parent_id=root_id)
+
+        assert index.get_root_id() == root_id
+        assert index.find_by_path("") == root_id
+
     def test_remove_node(self):
         """Test removing a node."""
         index = VaultIndex("test_vault")
@@ -106,50 +207,223 @@ class TestVaultIndex:
         assert len(loaded.nodes) == 3  # root + folder + file
         assert loaded.get_path(file_id) == "Folder/file.md"
 
+    def test_serialized_payload_tracks_changes(self):
+        """Test the serialized JSON payload matches to_dict as nodes change."""
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("VaultRoot", "folder")
+        assert orjson.loads(index._serialize()) == index.to_dict()
+
+        file_id = index.add_node("file.md", "file", parent_id=root_id)
+        assert orjson.loads(index._serialize()) == index.to_dict()
+
+        index.remove_node(file_id)
+        assert orjson.loads(index._serialize()) == index.to_dict()
+
+    def test_decrypt_reads_indented_json(self):
+        """Test indexes written as indented JSON by older versions still load."""
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("VaultRoot", "folder")
+        file_id = index.add_node("café.md", "file", parent_id=root_id)
+        key, nonce = os.urandom(32), os.urandom(12)
+
+        legacy = json.dumps(index.to_dict(), indent=2).encode("utf-8")
+        ciphertext, _ = encrypt_data(legacy, key, nonce)
+        loaded = VaultIndex.decrypt(ciphertext, key, nonce)
+
+        assert loaded.to_dict() == index.to_dict()
+        assert VaultIndex.decrypt(index.encrypt(key, nonce), key, nonce).get_path(file_id) == "café.md"
+
+    def test_encrypt_to_writer_matches_encrypt(self, tmp_path):
+        """Test streamed index encryption and save round-trip."""
+        index = VaultIndex("test_vault")
+        root_id = index.add_node("VaultRoot", "folder")
+        for i in range(2000):
+            index.add_node(f"note{i}.md", "file", parent_id=root_id)
+        key, nonce = os.urandom(32), os.urandom(12)
+
+        buf = io.BytesIO()
+        index.encrypt_to_writer(buf, key, nonce)
+        assert buf.getvalue() == index.encrypt(key, nonce)
+
+        index.save(tmp_path, key, os.urandom(16), nonce)
+        assert VaultIndex.load(tmp_path, key).to_dict() == index.to_dict()
+
 
 class TestVaultLayout:
     """Tests for vault layout."""
 
-    def test_initialize_vault(self):
+    def test_initialize_vault(self, tmp_path):
         """Test initializing a new vault."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            layout = VaultLayout(tmpdir)
-            vault_id = layout.initialize()
+        layout = VaultLayout(tmp_path)
+        vault_id = layout.initialize()
 
-            assert layout.exists()
-            assert len(vault_id) > 0
-            assert layout.get_vault_id() == vault_id
+        assert layout.exists()
+        assert len(vault_id) > 0
+        assert layout.get_vault_id() == vault_id
 
     def test_get_encrypted_file_path(self):
         """Test getting encrypted file path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            layout = VaultLayout(tmpdir)
-            layout.initialize()
+        layout = VaultLayout("vault")
+
+        file_path = layout.get_encrypted_file_path("abc123")
+        assert file_path.name == "abc123.enc"
+
+    def test_get_vault_id_cached(self, tmp_path):
+        """Test the vault ID is read from disk only once."""
+        VaultLayout(tmp_path).initialize()
+        layout = VaultLayout(tmp_path)
+        vault_id = layout.get_vault_id()
+
+        (tmp_path / ".vault_id").unlink()
 
-            file_path = layout.get_encrypted_file_path("abc123")
-            assert file_path.name == "abc123.enc"
+        assert layout.get_vault_id() == vault_id
+        assert not layout.exists()
+        with pytest.raises(FileNotFoundError):
+            VaultLayout(tmp_path).get_vault_id()
+
+    def test_list_encrypted_files(self, tmp_path):
+        """Test listing only regular encrypted files."""
+        layout = VaultLayout(tmp_path)
+        layout.initialize()
+        (tmp_path / "a.enc").write_bytes(b"a")
+        (tmp_path / "b.enc").write_bytes(b"b")
+        (tmp_path / "notes.md").write_bytes(b"c")
+        (tmp_path / "dir.enc").mkdir()
+
+        assert sorted(p.name for p in layout.list_encrypted_files()) == ["a.enc", "b.enc"]
+        assert VaultLayout(tmp_path / "missing").list_encrypted_files() == []
 
 
 class TestVaultManager:
     """Tests for vault manager."""
 
-    def test_create_vault(self):
+    def test_create_vault(self, unlocked_vault):
         """Test creating a new vault."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vault_path = Path(tmpdir) / "test_vault"
-            password = "test_password_123"
+        vault_path, _, _ = unlocked_vault
+
+        assert len(VaultLayout(vault_path).get_vault_id()) > 0
+        assert (vault_path / ".vault_id").exists()
+        assert (vault_path / "index.enc").exists()
+
+    def test_validity_follows_filesystem(self, tmp_path):
+        """Test validity reflects vaults created or removed after a check."""
+        vault_path = tmp_path / "test_vault"
+
+        assert not is_valid_vault(vault_path)
+
+        VaultManager.create_vault(vault_path, "test_password_123", "Test Vault")
+
+        assert is_valid_vault(vault_path)
+        assert is_valid_vault(str(vault_path))
+
+        (vault_path / "index.enc").unlink()
+
+        assert not is_valid_vault(vault_path)
+
+    def test_add_files_to_vault(self, tmp_path):
+        """Test bulk-added files decrypt to their original contents."""
+        vault_path, vault_key, salt = _create_unlocked_vault(tmp_path / "vault")
+        layout = VaultLayout(vault_path)
+        index = VaultIndex.load(vault_path, vault_key)
+
+        sources = []
+        for i in range(5):
+            source = tmp_path / f"note{i}.md"
+            source.write_text(f"note {i}")
+            sources.append(source)
+
+        node_ids = VaultManager.add_files_to_vault(vault_path, vault_key, index, sources, salt=salt)
+
+        assert [index.get_path(node_id) for node_id in node_ids] == [f"note{i}.md" for i in range(5)]
+        for i, node_id in enumerate(node_ids):
+            plaintext = open_and_decrypt(layout.get_encrypted_file_path(node_id), derive_file_key(vault_key, node_id))
+            assert plaintext == f"note {i}".encode()
+
+    def test_add_files_to_vault_rolls_back_on_failure(self, tmp_path, monkeypatch):
+        """Test a failing file removes every added node and written file."""
+        vault_path = tmp_path / "vault"
+        VaultLayout(vault_path).initialize()
+        index = VaultIndex("test_vault")
+        index.add_node("Root", "folder", node_id="root")
 
-            vault_id = VaultManager.create_vault(vault_path, password, "Test Vault")
+        sources = []
+        for i in range(5):
+            source = tmp_path / f"note{i}.md"
+            source.write_text(f"note {i}")
+            sources.append(source)
 
-            assert len(vault_id) > 0
-            assert vault_path.exists()
-            assert (vault_path / ".vault_id").exists()
-            assert (vault_path / "index.enc").exists()
+        original = VaultManager._encrypt_file_to_vault
 
-    def test_create_vault_empty_password_fails(self):
+        def encrypt(layout, vault_key, node_id, file_path, salt):
+            if file_path.name == "note3.md":
+                raise OSError("disk full")
+            original(layout, vault_key, node_id, file_path, salt)
+
+        monkeypatch.setattr(VaultManager, "_encrypt_file_to_vault", staticmethod(encrypt))
+
+        with pytest.raises(OSError):
+            VaultManager.add_files_to_vault(vault_path, b"k" * 32, index, sources)
+
+        assert list(index.nodes) == ["root"]
+        assert VaultLayout(vault_path).list_encrypted_files() == []
+
+    def test_add_large_file_streams(self, tmp_path, monkeypatch):
+        """Test files above the stream threshold round-trip through the vault."""
+        monkeypatch.setattr(vault_manager, "STREAM_ENCRYPT_THRESHOLD", 1024)
+
+        vault_path, vault_key, salt = _create_unlocked_vault(tmp_path / "vault")
+        layout = VaultLayout(vault_path)
+        index = VaultIndex.load(vault_path, vault_key)
+
+        source = tmp_path / "large.bin"
+        data = os.urandom(100_000)
+        source.write_bytes(data)
+
+        node_id = VaultManager.add_file_to_vault(vault_path, vault_key, index, source, salt=salt)
+
+        enc_path = layout.get_encrypted_file_path(node_id)
+        assert read_encrypted_file(str(enc_path)).file_id == node_id
+        assert open_and_decrypt(enc_path, derive_file_key(vault_key, node_id)) == data
+
+    def test_add_files_to_vault_missing_file(self, tmp_path):
+        """Test a missing file aborts the bulk add before touching the index."""
+        index = VaultIndex("test_vault")
+        index.add_node("Root", "folder", node_id="root")
+
+        with pytest.raises(FileNotFoundError):
+            VaultManager.add_files_to_vault(tmp_path, b"k" * 32, index, [tmp_path / "missing.md"])
+
+        assert len(index.nodes) == 1
+
+    def test_create_vault_empty_password_fails(self, tmp_path):
         """Test that empty password fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vault_path = Path(tmpdir) / "test_vault"
+        with pytest.raises(ValueError):
+            VaultManager.create_vault(tmp_path / "test_vault", "", "Test Vault")
+
+
+class TestDiscovery:
+    """Tests for vault discovery."""
+
+    @staticmethod
+    def _fake_vault(path: Path) -> None:
+        path.mkdir(parents=True)
+        (path / ".vault_id").write_text("id")
+        (path / "index.enc").write_bytes(b"index")
+
+    def test_discover_vaults(self, tmp_path):
+        """Test nested vaults are found and hidden/dependency dirs skipped."""
+        self._fake_vault(tmp_path / "a")
+        self._fake_vault(tmp_path / "b" / "c")
+        self._fake_vault(tmp_path / ".git" / "hidden")
+        self._fake_vault(tmp_path / "node_modules" / "dep")
+        (tmp_path / "d").mkdir()
+        (tmp_path / "d" / ".vault_id").write_text("no index")
+
+        found = sorted(discover_vaults(tmp_path))
+
+        assert found == [tmp_path / "a", tmp_path / "b" / "c"]
+        assert all(is_valid_vault(path) for path in found)
 
-            with pytest.raises(ValueError):
-                VaultManager.create_vault(vault_path, "", "Test Vault")
+    def test_discover_missing_path(self, tmp_path):
+        """Test a missing search path yields no vaults."""
+        assert discover_vaults(tmp_path / "missing") == []